@@ -1,6 +1,7 @@
 use serde::{Deserialize, Serialize};
 use std::ffi::CString;
 use std::os::raw::c_char;
+use std::sync::RwLock;
 
 /// Kafka configuration for EDA consumers
 #[derive(Debug, Clone, Serialize, Deserialize)]
@@ -20,9 +21,74 @@ impl Default for KafkaConfig {
     }
 }
 
-/// Get default Kafka configuration (static/mock implementation for PoC)
+/// Get Kafka configuration: PoC defaults, overridden by the `KAFKA_BROKER`, `KAFKA_TOPIC`
+/// and `KAFKA_GROUP` environment variables when set
 pub fn get_kafka_config() -> KafkaConfig {
-    KafkaConfig::default()
+    kafka_config_from(|name| std::env::var(name).ok())
+}
+
+/// Build Kafka configuration from PoC defaults and a variable lookup
+///
+/// Empty values fall back to the default. Taking the lookup as a parameter lets tests
+/// run without touching the process environment.
+pub(crate) fn kafka_config_from(lookup: impl Fn(&str) -> Option<String>) -> KafkaConfig {
+    let defaults = KafkaConfig::default();
+    let var_or = |name: &str, default: String| {
+        lookup(name)
+            .filter(|value| !value.is_empty())
+            .unwrap_or(default)
+    };
+    KafkaConfig {
+        broker: var_or("KAFKA_BROKER", defaults.broker),
+        topic: var_or("KAFKA_TOPIC", defaults.topic),
+        group: var_or("KAFKA_GROUP", defaults.group),
+    }
+}
+
+/// Kafka producer settings for output events
+///
+/// Field names in the routing YAML `producer` section follow librdkafka
+/// (`linger.ms`, `compression.type`, `batch.size`, `acks`, `queue.buffering.max.messages`).
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
+#[serde(default)]
+pub struct ProducerConfig {
+    #[serde(rename = "linger.ms")]
+    pub linger_ms: u32,
+    #[serde(rename = "compression.type")]
+    pub compression_type: String,
+    #[serde(rename = "batch.size")]
+    pub batch_size: u32,
+    pub acks: String,
+    #[serde(rename = "queue.buffering.max.messages")]
+    pub queue_buffering_max_messages: u32,
+}
+
+impl Default for ProducerConfig {
+    fn default() -> Self {
+        // Batch and compress output without holding events back noticeably
+        Self {
+            linger_ms: 10,
+            compression_type: "snappy".to_string(),
+            batch_size: 65536,
+            acks: "all".to_string(),
+            // Room for large input batches of output events awaiting delivery
+            queue_buffering_max_messages: 1_000_000,
+        }
+    }
+}
+
+static PRODUCER_CONFIG: RwLock<Option<ProducerConfig>> = RwLock::new(None);
+
+/// Get producer configuration: the loaded routing config's `producer` section, or defaults
+pub fn get_producer_config() -> ProducerConfig {
+    let config = PRODUCER_CONFIG.read().unwrap();
+    config.clone().unwrap_or_default()
+}
+
+/// Set producer configuration
+pub fn set_producer_config(config: ProducerConfig) {
+    let mut current = PRODUCER_CONFIG.write().unwrap();
+    *current = Some(config);
 }
 
 /// FFI-compatible function to get Kafka broker
@@ -69,6 +135,56 @@ pub extern "C" fn eda_free_string(s: *mut c_char) {
     }
 }
 
+/// FFI-compatible producer configuration structure
+#[repr(C)]
+pub struct CProducerConfig {
+    pub linger_ms: u32,
+    pub batch_size: u32,
+    pub queue_buffering_max_messages: u32,
+    pub compression_type: *mut c_char,
+    pub acks: *mut c_char,
+}
+
+/// FFI-compatible function to get producer configuration
+/// Returns a structure that must be freed with `eda_free_producer_config`
+#[no_mangle]
+pub extern "C" fn eda_get_producer_config() -> *mut CProducerConfig {
+    let config = get_producer_config();
+    let compression_type = match CString::new(config.compression_type) {
+        Ok(c_str) => c_str.into_raw(),
+        Err(_) => return std::ptr::null_mut(),
+    };
+    let acks = match CString::new(config.acks) {
+        Ok(c_str) => c_str.into_raw(),
+        Err(_) => {
+            // Free compression_type before returning
+            eda_free_string(compression_type);
+            return std::ptr::null_mut();
+        }
+    };
+
+    Box::into_raw(Box::new(CProducerConfig {
+        linger_ms: config.linger_ms,
+        batch_size: config.batch_size,
+        queue_buffering_max_messages: config.queue_buffering_max_messages,
+        compression_type,
+        acks,
+    }))
+}
+
+/// FFI-compatible function to free producer configuration returned by this library
+#[allow(clippy::not_unsafe_ptr_arg_deref)]
+#[no_mangle]
+pub extern "C" fn eda_free_producer_config(config: *mut CProducerConfig) {
+    if config.is_null() {
+        return;
+    }
+
+    let config_box = unsafe { Box::from_raw(config) };
+    eda_free_string(config_box.compression_type);
+    eda_free_string(config_box.acks);
+}
+
 #[cfg(target_arch = "wasm32")]
 use wasm_bindgen::prelude::*;
 
@@ -1,7 +1,7 @@
 //! EDA Core - Shared multi-language library for Event-Driven Architecture
 //!
 //! This library provides core functionality for EDA consumers across multiple languages:
-//! - Configuration management (Kafka broker, topic, consumer group)
+//! - Configuration management (Kafka broker, topic, consumer group, producer settings)
 //! - Retry logic with error classification and backoff
 //! - Event routing to destinations
 //! - Telemetry recording
@@ -17,7 +17,7 @@ pub mod telemetry;
 pub mod wit_bindings;
 
 // Re-export main types for convenience
-pub use config::{get_kafka_config, KafkaConfig};
+pub use config::{get_kafka_config, get_producer_config, KafkaConfig, ProducerConfig};
 pub use retry::{
     calculate_backoff, classify_error, get_retry_decision, should_retry, ErrorCategory,
     RetryDecision,
@@ -37,12 +37,36 @@ mod tests {
 
     #[test]
     fn test_default_config() {
-        let config = get_kafka_config();
+        let config = KafkaConfig::default();
         assert_eq!(config.broker, "localhost:9092");
         assert_eq!(config.topic, "events");
         assert_eq!(config.group, "poc");
     }
 
+    #[test]
+    fn test_config_env_override() {
+        let vars = std::collections::HashMap::from([
+            ("KAFKA_BROKER", "kafka:9093"),
+            ("KAFKA_TOPIC", ""),
+            ("KAFKA_GROUP", "e2e"),
+        ]);
+
+        let config = config::kafka_config_from(|name| vars.get(name).map(|v| v.to_string()));
+        assert_eq!(config.broker, "kafka:9093");
+        assert_eq!(config.topic, "events"); // Empty values fall back to the default
+        assert_eq!(config.group, "e2e");
+    }
+
+    #[test]
+    fn test_default_producer_config() {
+        let config = ProducerConfig::default();
+        assert_eq!(config.linger_ms, 10);
+        assert_eq!(config.compression_type, "snappy");
+        assert_eq!(config.batch_size, 65536);
+        assert_eq!(config.acks, "all");
+        assert_eq!(config.queue_buffering_max_messages, 1_000_000);
+    }
+
     #[test]
     fn test_retry_placeholder() {
         assert_eq!(should_retry("some error", 1), false);
@@ -51,6 +51,7 @@ pub fn calculate_backoff(_attempt: u32) -> u64 {
     // - Formula: min(base * 2^attempt * (1 + jitter), max_backoff)
     // - base: 100ms, max_backoff: 30000ms (30 seconds)
     // - jitter: random value between -0.25 and +0.25 to avoid thundering herd
+    //   (the Python SDK caches results per attempt in FFICore; drop that table with jitter)
     // - Record telemetry span for backoff calculation
     0
 }
@@ -108,6 +109,8 @@ pub extern "C" fn eda_get_retry_decision(
     result
 }
 
+/// Must stay a pure function of `(error, attempt)`: the Python SDK memoizes its
+/// results (`FFICore.should_retry`), so state-dependent decisions need that cache removed
 #[allow(clippy::not_unsafe_ptr_arg_deref)]
 #[no_mangle]
 pub extern "C" fn eda_should_retry(error: *const c_char, attempt: u32) -> i32 {
@@ -1,3 +1,4 @@
+use crate::config::{set_producer_config, ProducerConfig};
 use cloudevents::{AttributesReader, Event};
 use serde::Deserialize;
 use serde_json::Value;
@@ -237,6 +238,7 @@ pub fn set_default_destination(dest: OutputDestination) {
 #[derive(Debug, Deserialize)]
 struct RoutingConfig {
     routing: RoutingConfigInner,
+    producer: Option<ProducerConfig>,
 }
 
 #[derive(Debug, Deserialize)]
@@ -278,6 +280,9 @@ pub fn load_routing_config(file_path: &str) -> Result<(), String> {
         *default = None;
     }
 
+    // Producer settings not given in the file fall back to defaults
+    set_producer_config(config.producer.unwrap_or_default());
+
     // Set default destination if provided
     if let Some(default_config) = config.routing.default {
         let dest_type = parse_destination_type(&default_config.dest_type);
@@ -334,22 +339,8 @@ pub struct COutputDestination {
 
 use std::ffi::CString;
 
-#[allow(clippy::not_unsafe_ptr_arg_deref)]
-#[no_mangle]
-pub extern "C" fn eda_get_output_destination(event_json: *const c_char) -> *mut COutputDestination {
-    if event_json.is_null() {
-        return std::ptr::null_mut();
-    }
-
-    let json_str = unsafe {
-        match CStr::from_ptr(event_json).to_str() {
-            Ok(s) => s,
-            Err(_) => return std::ptr::null_mut(),
-        }
-    };
-
-    let dest = get_output_destination(json_str);
-
+/// Convert a destination into its FFI representation, returning None on interior NUL bytes
+fn to_c_destination(dest: OutputDestination) -> Option<COutputDestination> {
     let dest_type = match dest.dest_type {
         DestinationType::Kafka => 0,
         DestinationType::RabbitMQ => 1,
@@ -357,11 +348,7 @@ pub extern "C" fn eda_get_output_destination(event_json: *const c_char) -> *mut
         DestinationType::Discard => 3,
     };
 
-    // Handle CString creation gracefully - return null on error
-    let target = match CString::new(dest.target) {
-        Ok(c) => c.into_raw(),
-        Err(_) => return std::ptr::null_mut(),
-    };
+    let target = CString::new(dest.target).ok()?.into_raw();
 
     let cluster = match dest.cluster {
         Some(c) => match CString::new(c) {
@@ -371,17 +358,75 @@ pub extern "C" fn eda_get_output_destination(event_json: *const c_char) -> *mut
                 unsafe {
                     let _ = CString::from_raw(target);
                 }
-                return std::ptr::null_mut();
+                return None;
             }
         },
         None => std::ptr::null_mut(),
     };
 
-    Box::into_raw(Box::new(COutputDestination {
+    Some(COutputDestination {
         dest_type,
         target,
         cluster,
-    }))
+    })
+}
+
+/// Free the strings owned by an FFI destination
+fn free_c_destination_strings(dest: &COutputDestination) {
+    unsafe {
+        if !dest.target.is_null() {
+            let _ = CString::from_raw(dest.target);
+        }
+        if !dest.cluster.is_null() {
+            let _ = CString::from_raw(dest.cluster);
+        }
+    }
+}
+
+#[allow(clippy::not_unsafe_ptr_arg_deref)]
+#[no_mangle]
+pub extern "C" fn eda_get_output_destination(event_json: *const c_char) -> *mut COutputDestination {
+    if event_json.is_null() {
+        return std::ptr::null_mut();
+    }
+
+    let json_str = unsafe {
+        match CStr::from_ptr(event_json).to_str() {
+            Ok(s) => s,
+            Err(_) => return std::ptr::null_mut(),
+        }
+    };
+
+    // Handle CString creation gracefully - return null on error
+    match to_c_destination(get_output_destination(json_str)) {
+        Some(dest) => Box::into_raw(Box::new(dest)),
+        None => std::ptr::null_mut(),
+    }
+}
+
+/// Route an event given as a UTF-8 buffer and its length
+///
+/// Same as `eda_get_output_destination`, but the buffer needs no NUL terminator.
+#[allow(clippy::not_unsafe_ptr_arg_deref)]
+#[no_mangle]
+pub extern "C" fn eda_get_output_destination_n(
+    event_json: *const c_char,
+    len: usize,
+) -> *mut COutputDestination {
+    if event_json.is_null() {
+        return std::ptr::null_mut();
+    }
+
+    let bytes = unsafe { std::slice::from_raw_parts(event_json as *const u8, len) };
+    let json_str = match std::str::from_utf8(bytes) {
+        Ok(s) => s,
+        Err(_) => return std::ptr::null_mut(),
+    };
+
+    match to_c_destination(get_output_destination(json_str)) {
+        Some(dest) => Box::into_raw(Box::new(dest)),
+        None => std::ptr::null_mut(),
+    }
 }
 
 #[allow(clippy::not_unsafe_ptr_arg_deref)]
@@ -393,13 +438,67 @@ pub extern "C" fn eda_free_output_destination(dest: *mut COutputDestination) {
 
     unsafe {
         let dest_box = Box::from_raw(dest);
-        if !dest_box.target.is_null() {
-            let _ = CString::from_raw(dest_box.target);
+        free_c_destination_strings(&dest_box);
+    }
+}
+
+/// Separator between events passed to `eda_get_output_destinations` (ASCII record separator,
+/// which cannot appear unescaped in JSON)
+const EVENT_SEPARATOR: char = '\x1e';
+
+/// Route a batch of events in a single FFI call
+///
+/// `events_json` holds `count` JSON-serialized events separated by 0x1E. Returns an array of
+/// `count` destinations in input order, to be freed with `eda_free_output_destinations`,
+/// or null if the input is invalid.
+#[allow(clippy::not_unsafe_ptr_arg_deref)]
+#[no_mangle]
+pub extern "C" fn eda_get_output_destinations(
+    events_json: *const c_char,
+    count: usize,
+) -> *mut COutputDestination {
+    if events_json.is_null() || count == 0 {
+        return std::ptr::null_mut();
+    }
+
+    let json_str = unsafe {
+        match CStr::from_ptr(events_json).to_str() {
+            Ok(s) => s,
+            Err(_) => return std::ptr::null_mut(),
         }
-        if !dest_box.cluster.is_null() {
-            let _ = CString::from_raw(dest_box.cluster);
+    };
+
+    let events: Vec<&str> = json_str.split(EVENT_SEPARATOR).collect();
+    if events.len() != count {
+        return std::ptr::null_mut();
+    }
+
+    let mut dests = Vec::with_capacity(count);
+    for event in events {
+        match to_c_destination(get_output_destination(event)) {
+            Some(dest) => dests.push(dest),
+            None => {
+                dests.iter().for_each(free_c_destination_strings);
+                return std::ptr::null_mut();
+            }
         }
     }
+
+    Box::into_raw(dests.into_boxed_slice()) as *mut COutputDestination
+}
+
+/// Free an array returned by `eda_get_output_destinations`
+#[allow(clippy::not_unsafe_ptr_arg_deref)]
+#[no_mangle]
+pub extern "C" fn eda_free_output_destinations(dests: *mut COutputDestination, count: usize) {
+    if dests.is_null() {
+        return;
+    }
+
+    unsafe {
+        let dests_box = Box::from_raw(std::ptr::slice_from_raw_parts_mut(dests, count));
+        dests_box.iter().for_each(free_c_destination_strings);
+    }
 }
 
 /// Load routing configuration from a YAML file via FFI
@@ -569,4 +668,52 @@ mod tests {
         assert_eq!(result.dest_type, DestinationType::Kafka);
         assert_eq!(result.target, "events");
     }
+
+    #[test]
+    fn test_ffi_length_variant_ignores_trailing_bytes() {
+        reset_routing_state();
+
+        let json = r#"{"specversion":"1.0","type":"test","source":"test","id":"1"}"#;
+        let buffer = format!("{json}garbage");
+
+        let dest = eda_get_output_destination_n(buffer.as_ptr() as *const c_char, json.len());
+        assert!(!dest.is_null());
+        assert_eq!(unsafe { (*dest).dest_type }, 0);
+        eda_free_output_destination(dest);
+    }
+
+    #[test]
+    fn test_ffi_batch_preserves_order() {
+        reset_routing_state();
+
+        let rule = RoutingRule {
+            name: "http-rule".to_string(),
+            filter: r#"{"exact":{"type":"to.http"}}"#.to_string(),
+            destination: OutputDestination {
+                dest_type: DestinationType::Http,
+                target: "http://example.com".to_string(),
+                cluster: None,
+            },
+        };
+
+        add_routing_rule(rule);
+
+        let events = CString::new(concat!(
+            r#"{"specversion":"1.0","type":"to.http","source":"test","id":"1"}"#,
+            "\x1e",
+            r#"{"specversion":"1.0","type":"other","source":"test","id":"2"}"#,
+        ))
+        .unwrap();
+
+        let dests = eda_get_output_destinations(events.as_ptr(), 2);
+        assert!(!dests.is_null());
+        let slice = unsafe { std::slice::from_raw_parts(dests, 2) };
+        assert_eq!(slice[0].dest_type, 2);
+        assert!(slice[0].cluster.is_null());
+        assert_eq!(slice[1].dest_type, 0);
+        eda_free_output_destinations(dests, 2);
+
+        // Count mismatch is rejected
+        assert!(eda_get_output_destinations(events.as_ptr(), 3).is_null());
+    }
 }
@@ -1,12 +1,17 @@
 #!/bin/bash
-# Usage: ./send-test-event.sh [event-type] [data]
+# Usage: [KAFKA_TOPIC=topic] ./send-test-event.sh [event-type] [data]
 
 EVENT_TYPE=${1:-"eda-mlang-test"}
 DATA=${2:-"Hello from test"}
+# Same variable the core reads, so a test can point sender and example at one topic
+TOPIC=${KAFKA_TOPIC:-"events"}
 
-echo "Building CloudEvent and sending to Kafka topic 'events'..."
+echo "Building CloudEvent and sending to Kafka topic '$TOPIC'..."
 echo ""
 
+# Topics other than 'events' are not created by 'make up'
+podman exec redpanda rpk topic create "$TOPIC" --partitions 1 --replicas 1 >/dev/null 2>&1 || true
+
 # Build CloudEvent using kn-event and send to Kafka via rpk
 # Send 10 events to match test expectations
 for i in {1..10}; do
@@ -14,7 +19,7 @@ for i in {1..10}; do
     --type "$EVENT_TYPE" \
     --source "/test" \
     --field "message=$DATA" \
-    --output json | jq -c | podman exec -i redpanda rpk topic produce events
+    --output json | jq -c | podman exec -i redpanda rpk topic produce "$TOPIC"
 done
 
 echo ""
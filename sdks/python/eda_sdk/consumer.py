@@ -1,14 +1,19 @@
 """Kafka consumer with CloudEvents support."""
 
+import base64
+import functools
 import logging
-from typing import Callable, Optional, Union
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Union
 
+import orjson
 from cloudevents.http import CloudEvent
-from cloudevents.kafka import KafkaMessage, from_binary, from_structured, to_structured
+from cloudevents.kafka import KafkaMessage, to_structured
 from confluent_kafka import Consumer as KafkaConsumer, KafkaError, KafkaException, Message, Producer
 
 from .core import Core
-from .types import DestinationType
+from .types import DestinationType, OutputDestination
 
 # Type aliases for handler functions
 SimpleHandler = Callable[[CloudEvent], None]
@@ -17,16 +22,141 @@ Handler = Union[SimpleHandler, OutputHandler]
 
 logger = logging.getLogger(__name__)
 
+# Envelope serializer for outbound events (orjson returns bytes directly). Datetime
+# attributes and data values are written natively as RFC 3339, naive ones as UTC.
+# Non-str dict keys are stringified as json.dumps does; unlike json.dumps, integers
+# beyond 64 bits are rejected
+_ENCODE = functools.partial(
+    orjson.dumps, option=orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+)
+# JSON parser for inbound message values
+_DECODE = orjson.loads
+
+# How long a batch waits for its output events to be delivered before committing
+_DELIVERY_TIMEOUT_S = 30.0
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment.
+
+    Args:
+        name: Environment variable name.
+        default: Value used when the variable is unset or empty.
+
+    Returns:
+        The parsed integer value.
+
+    Raises:
+        RuntimeError: If the variable is set to a non-integer value.
+    """
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError as e:
+        raise RuntimeError(f"Invalid integer value for {name}: {value!r}") from e
+
+
+def _event_from_structured(doc: dict[str, Any], key: Optional[Union[str, bytes]]) -> CloudEvent:
+    """Build a CloudEvent from a decoded structured-mode envelope.
+
+    Mirrors cloudevents.kafka.from_structured without re-parsing the JSON.
+
+    Args:
+        doc: Decoded JSON envelope (consumed by this call).
+        key: Kafka message key, exposed as the partitionkey attribute.
+
+    Returns:
+        The CloudEvent.
+
+    Raises:
+        MissingRequiredFields: If required CloudEvent attributes are absent.
+    """
+    data = doc.pop("data", None)
+    if "data_base64" in doc:
+        data = base64.b64decode(doc.pop("data_base64"))
+    if key is not None:
+        doc.setdefault("partitionkey", key)
+    return CloudEvent(doc, data)
+
+
+def _event_from_binary(
+    headers: list[tuple[str, Union[str, bytes, None]]],
+    key: Optional[Union[str, bytes]],
+    data: Any,
+) -> Optional[CloudEvent]:
+    """Build a CloudEvent from binary-mode Kafka headers and a decoded body.
+
+    Mirrors cloudevents.kafka.from_binary, reading attributes straight from the
+    confluent_kafka header list without an intermediate KafkaMessage.
+
+    Args:
+        headers: Kafka message headers.
+        key: Kafka message key, exposed as the partitionkey attribute.
+        data: Decoded message body.
+
+    Returns:
+        The CloudEvent, or None if no ce_* headers are present.
+
+    Raises:
+        MissingRequiredFields: If required CloudEvent attributes are absent.
+    """
+    attributes: dict[str, Any] = {}
+    has_ce_headers = False
+    for name, val in headers:
+        if val is None:
+            continue
+        name = name.lower()
+        if name == "content-type":
+            attributes["datacontenttype"] = val.decode() if isinstance(val, bytes) else val
+        elif name.startswith("ce_"):
+            attributes[name[3:]] = val.decode() if isinstance(val, bytes) else val
+            has_ce_headers = True
+
+    if not has_ce_headers:
+        return None
+    if key is not None:
+        attributes["partitionkey"] = key
+    return CloudEvent(attributes, data)
+
+
+def _serialize_event(event: CloudEvent) -> KafkaMessage:
+    """Serialize a CloudEvent to a structured-mode Kafka message.
+
+    Args:
+        event: The CloudEvent to serialize.
+
+    Returns:
+        KafkaMessage with the JSON envelope as value and CloudEvents headers.
+    """
+    return to_structured(event, envelope_marshaller=_ENCODE)
+
 
 class Consumer:
     """Manages Kafka consumption and event processing."""
 
-    def __init__(self, core: Core, handler: Handler) -> None:
+    def __init__(
+        self,
+        core: Core,
+        handler: Handler,
+        batch_size: int = 500,
+        poll_timeout_s: Optional[float] = None,
+        workers: Optional[int] = None,
+    ) -> None:
         """Initialize the consumer.
 
         Args:
             core: Core implementation (FFI or WASM).
             handler: User's event handler function.
+            batch_size: Maximum number of messages fetched per consume() call.
+            poll_timeout_s: Maximum time in seconds to wait for a batch. Defaults to
+                1.5x the broker fetch wait (fetch.wait.max.ms).
+            workers: Number of threads used to process the partitions of each batch
+                in parallel; messages of one partition are still handled in order.
+                Values above 1 help handlers that release the GIL (I/O, native
+                inference). Defaults to the EDA_WORKERS environment variable, or 1
+                (no pool).
 
         Raises:
             RuntimeError: If initialization fails.
@@ -35,6 +165,32 @@ class Consumer:
         self.handler = handler
         self._consumer: Optional[KafkaConsumer] = None
         self._producer: Optional[Producer] = None
+        self._batch_size = batch_size
+
+        # ids of the current batch's input messages whose output event is not yet
+        # confirmed delivered; replaced per batch, so late delivery reports for an
+        # earlier batch never confirm a message of the current one
+        self._unconfirmed: set[int] = set()
+
+        if workers is None:
+            workers = _env_int("EDA_WORKERS", 1)
+        self._pool: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="eda-worker")
+            if workers > 1
+            else None
+        )
+
+        # Fetch tuning (overridable via environment)
+        fetch_min_bytes = _env_int("EDA_FETCH_MIN_BYTES", 1_048_576)
+        fetch_wait_max_ms = _env_int("EDA_FETCH_WAIT_MAX_MS", 500)
+        max_partition_fetch_bytes = _env_int("EDA_MAX_PARTITION_FETCH_BYTES", 10_485_760)
+        queued_min_messages = _env_int("EDA_QUEUED_MIN_MESSAGES", 100_000)
+
+        # Wait slightly longer than the broker-side fetch wait so a consume()
+        # call normally returns a full fetch rather than timing out first
+        self._poll_timeout_s = (
+            poll_timeout_s if poll_timeout_s is not None else 1.5 * fetch_wait_max_ms / 1000
+        )
 
         # Detect handler signature
         self._is_output_handler = self._detect_output_handler(handler)
@@ -46,23 +202,42 @@ class Consumer:
             extra={"broker": config.broker, "topic": config.topic, "group": config.group},
         )
 
-        # Create Kafka consumer with manual commit for at-least-once delivery
+        # Create Kafka consumer with manual commit: offsets are stored per handled
+        # message whose output event (if any) was delivered, and committed once per batch
         self._consumer = KafkaConsumer(
             {
                 "bootstrap.servers": config.broker,
                 "group.id": config.group,
                 "auto.offset.reset": "earliest",
                 "enable.auto.commit": False,  # Manual commit after successful processing
+                # Offsets are stored per handled message, so the commit covers each
+                # partition up to its last handled message; earlier messages whose
+                # handler failed (or that could not be parsed) are skipped, not retried
+                "enable.auto.offset.store": False,
+                "fetch.min.bytes": fetch_min_bytes,
+                "fetch.wait.max.ms": fetch_wait_max_ms,
+                "max.partition.fetch.bytes": max_partition_fetch_bytes,
+                "queued.min.messages": queued_min_messages,
             }
         )
 
         # Subscribe to topic
         self._consumer.subscribe([config.topic])
-        logger.info(f"Subscribed to topic: {config.topic}")
+        logger.info("Subscribed to topic: %s", config.topic)
 
         # Create Kafka producer for output events (if handler returns events)
         if self._is_output_handler:
-            self._producer = Producer({"bootstrap.servers": config.broker})
+            # Batch and compress output; delivery is awaited once per input batch
+            self._producer = Producer(
+                {
+                    "bootstrap.servers": config.broker,
+                    "linger.ms": config.linger_ms,
+                    "batch.size": config.batch_size,
+                    "compression.type": config.compression_type,
+                    "acks": config.acks,
+                    "queue.buffering.max.messages": config.queue_buffering_max_messages,
+                }
+            )
             logger.info("Kafka producer initialized for output events")
 
     def _detect_output_handler(self, handler: Handler) -> bool:
@@ -96,66 +271,148 @@ class Consumer:
         consecutive_errors = 0
         max_consecutive_errors = 5
 
+        # Bind hot-path lookups to locals once, outside the polling loop
+        consume = self._consumer.consume
+        commit = self._consumer.commit
+        store = self._consumer.store_offsets
+        process = self._process_messages
+        flush = self._producer.flush if self._producer is not None else None
+        submit = self._pool.submit if self._pool is not None else None
+        log_err = logger.error
+        batch_size = self._batch_size
+        poll_timeout_s = self._poll_timeout_s
+        partition_eof = KafkaError._PARTITION_EOF  # type: ignore[attr-defined]
+
         try:
             while True:
-                # Poll for messages with timeout
-                msg = self._consumer.poll(timeout=0.1)
-
-                if msg is None:
-                    continue
+                # Fetch a batch of messages in a single librdkafka call
+                msgs = consume(num_messages=batch_size, timeout=poll_timeout_s)
 
-                if msg.error():
-                    error = msg.error()
-                    if error is not None and error.code() == KafkaError._PARTITION_EOF:  # type: ignore[attr-defined]
-                        # End of partition, not an error
-                        continue
-                    else:
-                        logger.error(f"Consumer error: {msg.error()}")
-                        consecutive_errors += 1
-                        if consecutive_errors >= max_consecutive_errors:
-                            raise KafkaException(msg.error())
-                        continue
-
-                # Reset error counter on successful read
-                consecutive_errors = 0
-
-                # Parse CloudEvent
-                event = self._parse_cloud_event(msg)
-                if event is None:
+                if not msgs:
                     continue
 
-                # Call user handler
-                try:
-                    self._invoke_handler(event)
-                    # Commit offset after successful processing
-                    if self._consumer is not None:
-                        self._consumer.commit(asynchronous=False)
-                except Exception as e:
-                    logger.error(f"Handler error: {e}", extra={"event_type": event["type"]})
-
-                    # Check if we should retry using core
-                    try:
-                        should_retry = self.core.should_retry(str(e), 1)
-                        if should_retry:
-                            backoff = self.core.calculate_backoff(1)
-                            logger.warning(
-                                "Would retry after backoff (not implemented in PoC)",
-                                extra={"backoff_ms": backoff},
-                            )
-                    except Exception as retry_err:
-                        logger.error(f"Error checking retry: {retry_err}")
+                valid: list[Message] = []
+                for msg in msgs:
+                    if msg.error():
+                        error = msg.error()
+                        if error is not None and error.code() == partition_eof:
+                            # End of partition, not an error
+                            continue
+                        else:
+                            log_err("Consumer error: %s", msg.error())
+                            consecutive_errors += 1
+                            if consecutive_errors >= max_consecutive_errors:
+                                raise KafkaException(msg.error())
+                            continue
+
+                    # Reset error counter on successful read
+                    consecutive_errors = 0
+                    valid.append(msg)
+
+                if submit is None:
+                    done = process(valid)
+                else:
+                    # One worker task per partition: partitions run in parallel (native
+                    # routing releases the GIL) while each keeps its message order
+                    partitions: dict[tuple[Optional[str], Optional[int]], list[Message]] = {}
+                    for msg in valid:
+                        partitions.setdefault((msg.topic(), msg.partition()), []).append(msg)
+                    futures = [submit(process, part) for part in partitions.values()]
+                    done = [msg for future in futures for msg in future.result()]
+
+                # Wait (bounded) for the batch's output events to be delivered; inputs
+                # whose output failed or is still pending are not stored. Sends are still
+                # batched by the producer
+                if flush is not None and done:
+                    pending = flush(_DELIVERY_TIMEOUT_S)
+                    if pending:
+                        logger.warning("%d output events not delivered in time", pending)
+                    unconfirmed, self._unconfirmed = self._unconfirmed, set()
+                    if unconfirmed:
+                        done = [msg for msg in done if id(msg) not in unconfirmed]
+
+                # Mark offsets for commit; one commit round-trip per batch
+                for msg in done:
+                    store(message=msg)
+                if done:
+                    commit(asynchronous=True)
 
         except KeyboardInterrupt:
             logger.info("Consumer interrupted")
         finally:
             self.close()
 
+    def _process_messages(self, msgs: list[Message]) -> list[Message]:
+        """Parse and handle messages in order, then route and publish their outputs.
+
+        Runs on the polling thread, or on a worker thread for one partition.
+
+        Args:
+            msgs: Kafka messages, in partition order.
+
+        Returns:
+            Messages fully processed (output queued for publishing, if any), in input
+            order. Queued outputs are tracked until delivered (see ``start``).
+        """
+        parse = self._parse_cloud_event
+        invoke: OutputHandler = self.handler
+        keep_outputs = self._is_output_handler
+
+        # Messages handled successfully, with the output event they produced
+        handled: list[tuple[Message, Optional[CloudEvent]]] = []
+        for msg in msgs:
+            # Parse CloudEvent
+            event = parse(msg)
+            if event is None:
+                continue
+
+            # Call user handler
+            try:
+                output = invoke(event)
+            except Exception as e:
+                self._handle_handler_error(e, event)
+                continue
+            handled.append((msg, output if keep_outputs else None))
+
+        # Route and publish the output events together
+        with_output = [(msg, output) for msg, output in handled if output is not None]
+        if not with_output:
+            return [msg for msg, _ in handled]
+        published = iter(
+            self._publish_output_events(
+                [output for _, output in with_output], [msg for msg, _ in with_output]
+            )
+        )
+        return [msg for msg, output in handled if output is None or next(published)]
+
+    def _handle_handler_error(self, error: Exception, event: CloudEvent) -> None:
+        """Log a handler failure and consult the core retry policy.
+
+        Args:
+            error: The exception raised by the handler.
+            event: The CloudEvent being processed.
+        """
+        logger.error("Handler error: %s", error, extra={"event_type": event["type"]})
+
+        # Check if we should retry using core
+        try:
+            if self.core.should_retry(str(error), 1):
+                backoff = self.core.calculate_backoff(1)
+                logger.warning(
+                    "Would retry after backoff (not implemented in PoC)",
+                    extra={"backoff_ms": backoff},
+                )
+        except Exception as retry_err:
+            logger.error("Error checking retry: %s", retry_err)
+
     def _parse_cloud_event(self, msg: Message) -> Optional[CloudEvent]:
         """Convert Kafka message to CloudEvent.
 
         Tries multiple parsing strategies in order:
-        1. Structured mode: Full CloudEvent as JSON in Kafka value (content-type in headers)
-        2. Binary mode: CloudEvent attributes in Kafka headers, data in body
+        1. Structured mode: Full CloudEvent as JSON in Kafka value (headers not needed)
+        2. Binary mode: CloudEvent attributes in ce_* Kafka headers, data in body
+
+        Headers are only decoded when structured parsing fails.
 
         Args:
             msg: Kafka message.
@@ -168,58 +425,94 @@ class Consumer:
             logger.warning("Received message with None value, skipping")
             return None
 
-        # Convert confluent_kafka Message to cloudevents KafkaMessage
-        headers: dict[str, bytes] = {}
-        msg_headers = msg.headers()
-        if msg_headers is not None:
-            for key, val in msg_headers:  # type: ignore[misc]
-                if val is not None:
-                    # Ensure val is bytes
-                    if isinstance(val, str):
-                        headers[key] = val.encode("utf-8")
-                    elif isinstance(val, bytes):
-                        headers[key] = val
-
-        kafka_msg = KafkaMessage(headers=headers, key=msg.key(), value=value)
-
-        # Try 1: Structured mode (CE attributes in headers, data in body)
+        key = msg.key()
+
+        # Both modes carry JSON in the body, so decode it once up front
         try:
-            event = from_structured(kafka_msg)
-            return event
-        except Exception:
-            pass  # Not structured mode, try next method
+            doc = _DECODE(value)
+        except orjson.JSONDecodeError as e:
+            logger.warning("Failed to parse CloudEvent: %s", e)
+            return None
 
-        # Try 2: Binary mode (full CloudEvent JSON in body)
+        # Try 1: Structured mode (full CloudEvent JSON in body)
+        if isinstance(doc, dict):
+            try:
+                return _event_from_structured(dict(doc), key)
+            except Exception:
+                pass  # Not structured mode, try next method
+
+        # Try 2: Binary mode (CE attributes in headers, data in body)
         try:
-            event = from_binary(kafka_msg)
-            return event
+            # Consumed messages always report headers as a list of tuples
+            event = _event_from_binary(msg.headers() or [], key, doc)  # type: ignore[arg-type]
         except Exception as e:
-            logger.warning(f"Failed to parse CloudEvent: {e}")
+            logger.warning("Failed to parse CloudEvent: %s", e)
             return None
+        if event is None:
+            logger.warning("Failed to parse CloudEvent: not structured and no ce_* headers")
+        return event
 
-    def _invoke_handler(self, event: CloudEvent) -> None:
-        """Call the user's handler function and handle output events.
+    def _publish_output_events(
+        self, events: list[CloudEvent], sources: list[Message]
+    ) -> list[bool]:
+        """Route a batch of output events with a single core call and publish them.
 
         Args:
-            event: The CloudEvent to process.
+            events: The CloudEvents to publish.
+            sources: Input message each event was produced for.
 
-        Raises:
-            Exception: If handler or output publishing fails.
+        Returns:
+            Whether each event was published, in input order.
         """
-        if self._is_output_handler:
-            # Handler returns Optional[CloudEvent]
-            output_event = self.handler(event)  # type: ignore
-            if output_event is not None:
-                self._publish_output_event(output_event)
-        else:
-            # Simple handler returns None
-            self.handler(event)  # type: ignore
+        results = [False] * len(events)
+
+        # Serialize complete events (attributes + extensions) once for routing and publishing;
+        # an event that cannot be serialized fails on its own
+        serialized: list[tuple[int, KafkaMessage]] = []
+        for i, event in enumerate(events):
+            try:
+                serialized.append((i, _serialize_event(event)))
+            except Exception as e:
+                self._handle_handler_error(e, event)
+        if not serialized:
+            return results
+
+        events_json = [
+            (
+                kafka_msg.value
+                if isinstance(kafka_msg.value, bytes)
+                else kafka_msg.value.encode("utf-8")
+            )
+            for _, kafka_msg in serialized
+        ]
 
-    def _publish_output_event(self, event: CloudEvent) -> None:
-        """Route and publish an output event.
+        # Get output destinations from core routing
+        try:
+            dests = self.core.get_output_destinations(events_json)
+        except Exception as e:
+            logger.error("Failed to route %d output events: %s", len(events_json), e)
+            for i, _ in serialized:
+                self._handle_handler_error(e, events[i])
+            return results
+
+        for (i, kafka_msg), dest in zip(serialized, dests):
+            try:
+                self._publish_output_event(events[i], dest, kafka_msg, sources[i])
+                results[i] = True
+            except Exception as e:
+                self._handle_handler_error(e, events[i])
+        return results
+
+    def _publish_output_event(
+        self, event: CloudEvent, dest: OutputDestination, kafka_msg: KafkaMessage, source: Message
+    ) -> None:
+        """Publish a routed output event.
 
         Args:
             event: The CloudEvent to publish.
+            dest: Destination returned by core routing.
+            kafka_msg: The event serialized in structured mode.
+            source: Input message the event was produced for.
 
         Raises:
             RuntimeError: If publishing fails.
@@ -227,45 +520,76 @@ class Consumer:
         if self._producer is None:
             raise RuntimeError("Producer not initialized")
 
-        # Serialize complete event (attributes + extensions) for routing
-        kafka_msg = to_structured(event)
-        event_json = (
-            kafka_msg.value.decode("utf-8")
-            if isinstance(kafka_msg.value, bytes)
-            else kafka_msg.value
-        )
+        # Only build the structured extra when INFO records are actually emitted
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Routing output event",
+                extra={
+                    "event_type": event["type"],
+                    "dest_type": dest.type.name,
+                    "dest_target": dest.target,
+                },
+            )
 
-        # Get output destination from core routing
-        dest = self.core.get_output_destination(event_json)
+        # Dispatch on destination type
+        publish = _DESTINATION_PUBLISHERS.get(dest.type)
+        if publish is None:
+            raise RuntimeError(f"Unknown destination type: {dest.type}")
+        publish(self, event, dest.target, kafka_msg, source)
 
-        logger.info(
-            "Routing output event",
-            extra={
-                "event_type": event["type"],
-                "dest_type": dest.type.name,
-                "dest_target": dest.target,
-            },
-        )
+    def _discard(
+        self, event: CloudEvent, target: str, kafka_msg: KafkaMessage, source: Message
+    ) -> None:
+        """Drop an output event routed to the discard destination.
 
-        # Handle different destination types
-        if dest.type == DestinationType.KAFKA:
-            self._publish_to_kafka(event, dest.target)
-        elif dest.type == DestinationType.DISCARD:
-            logger.info(f"Discarding output event: {event['type']}")
-        elif dest.type in (DestinationType.HTTP, DestinationType.RABBITMQ):
-            # TODO: Implement HTTP and RabbitMQ publishing
-            logger.warning(
-                f"Destination type {dest.type.name} not yet implemented, discarding event"
-            )
-        else:
-            raise RuntimeError(f"Unknown destination type: {dest.type}")
+        Args:
+            event: The CloudEvent to drop.
+            target: Unused destination target.
+            kafka_msg: Unused serialized event.
+            source: Unused input message.
+        """
+        logger.info("Discarding output event: %s", event["type"])
+
+    def _publish_to_http(
+        self, event: CloudEvent, target: str, kafka_msg: KafkaMessage, source: Message
+    ) -> None:
+        """Publish an event to an HTTP endpoint (not yet implemented, event is dropped).
 
-    def _publish_to_kafka(self, event: CloudEvent, topic: str) -> None:
+        Args:
+            event: The CloudEvent to publish.
+            target: The HTTP endpoint URL.
+            kafka_msg: The event already serialized in structured mode.
+            source: Input message the event was produced for.
+        """
+        # TODO: Implement HTTP publishing
+        logger.warning("Destination type HTTP not yet implemented, discarding event")
+
+    def _publish_to_rabbitmq(
+        self, event: CloudEvent, target: str, kafka_msg: KafkaMessage, source: Message
+    ) -> None:
+        """Publish an event to RabbitMQ (not yet implemented, event is dropped).
+
+        Args:
+            event: The CloudEvent to publish.
+            target: The RabbitMQ exchange or queue.
+            kafka_msg: The event already serialized in structured mode.
+            source: Input message the event was produced for.
+        """
+        # TODO: Implement RabbitMQ publishing
+        logger.warning("Destination type RABBITMQ not yet implemented, discarding event")
+
+    def _publish_to_kafka(
+        self, event: CloudEvent, topic: str, kafka_msg: KafkaMessage, source: Message
+    ) -> None:
         """Publish an event to a Kafka topic.
 
+        The source message stays unconfirmed until the producer reports delivery.
+
         Args:
             event: The CloudEvent to publish.
             topic: The Kafka topic name.
+            kafka_msg: The event already serialized in structured mode.
+            source: Input message the event was produced for.
 
         Raises:
             RuntimeError: If publishing fails.
@@ -273,8 +597,6 @@ class Consumer:
         if self._producer is None:
             raise RuntimeError("Producer not initialized")
 
-        # Serialize complete event (attributes + extensions) using CloudEvents SDK
-        kafka_msg = to_structured(event)
         event_json = (
             kafka_msg.value
             if isinstance(kafka_msg.value, bytes)
@@ -286,27 +608,81 @@ class Consumer:
             [(k, v) for k, v in kafka_msg.headers.items()] if kafka_msg.headers else None
         )
 
-        # Produce to Kafka
-        self._producer.produce(
-            topic=topic,
-            value=event_json,
-            key=event["id"].encode("utf-8"),
-            headers=headers,
-        )
-        self._producer.flush()
+        # Produce to Kafka (queued; librdkafka batches the actual sends)
+        produce_kwargs: dict[str, Any] = {
+            "topic": topic,
+            "value": event_json,
+            "key": event["id"].encode("utf-8"),
+            "headers": headers,
+            "on_delivery": functools.partial(self._on_delivery, self._unconfirmed, id(source)),
+        }
+        self._unconfirmed.add(id(source))
+        try:
+            self._producer.produce(**produce_kwargs)
+        except BufferError:
+            # Local queue is full: serve delivery reports to make room, then retry once
+            self._producer.poll(1)
+            self._producer.produce(**produce_kwargs)
+
+        # Serve delivery callbacks without blocking
+        self._producer.poll(0)
 
-        logger.info(f"Published output event to Kafka topic: {topic}")
+        logger.info("Published output event to Kafka topic: %s", topic)
+
+    def _on_delivery(
+        self, unconfirmed: set[int], source_id: int, err: Optional[KafkaError], msg: Message
+    ) -> None:
+        """Confirm an input message once its output event is delivered, or log the failure.
+
+        Args:
+            unconfirmed: Unconfirmed input message ids of the batch the event belongs to.
+            source_id: id of the input message the event was produced for.
+            err: Delivery error, or None on success.
+            msg: The produced message.
+        """
+        if err is not None:
+            logger.error("Failed to deliver output event to %s: %s", msg.topic(), err)
+        else:
+            unconfirmed.discard(source_id)
 
     def close(self) -> None:
-        """Release resources."""
+        """Release resources.
+
+        Safe to call more than once (e.g. from a signal handler and again when
+        ``start`` unwinds); resources already released are skipped.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+            logger.info("Worker pool stopped")
+
         if self._producer is not None:
             self._producer.flush(timeout=5)
+            self._producer = None
             logger.info("Producer flushed")
 
         if self._consumer is not None:
-            self._consumer.close()
+            consumer, self._consumer = self._consumer, None
+            # Synchronously commit offsets stored since the last batch commit
+            try:
+                consumer.commit(asynchronous=False)
+            except KafkaException as e:
+                if e.args[0].code() != KafkaError._NO_OFFSET:  # type: ignore[attr-defined]
+                    logger.warning("Failed to commit offsets on close: %s", e)
+            consumer.close()
             logger.info("Consumer closed")
 
         if self.core is not None:
             self.core.close()
             logger.info("Core closed")
+
+
+# Output publishers by destination type, resolved with a single dict lookup per event
+_DESTINATION_PUBLISHERS: dict[
+    DestinationType, Callable[[Consumer, CloudEvent, str, KafkaMessage, Message], None]
+] = {
+    DestinationType.KAFKA: Consumer._publish_to_kafka,
+    DestinationType.DISCARD: Consumer._discard,
+    DestinationType.HTTP: Consumer._publish_to_http,
+    DestinationType.RABBITMQ: Consumer._publish_to_rabbitmq,
+}
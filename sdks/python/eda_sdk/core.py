@@ -15,7 +15,7 @@ class Core(Protocol):
         """Retrieve the Kafka connection configuration.
 
         Returns:
-            KafkaConfig with broker, topic, and group settings.
+            KafkaConfig with broker, topic, group, and producer settings.
 
         Raises:
             RuntimeError: If configuration cannot be retrieved.
@@ -51,11 +51,11 @@ class Core(Protocol):
         """
         ...
 
-    def get_output_destination(self, event_json: str) -> OutputDestination:
+    def get_output_destination(self, event_json: bytes) -> OutputDestination:
         """Route an output event to its destination.
 
         Args:
-            event_json: JSON-serialized CloudEvent.
+            event_json: JSON-serialized CloudEvent (UTF-8 encoded).
 
         Returns:
             OutputDestination specifying where to send the event.
@@ -65,9 +65,26 @@ class Core(Protocol):
         """
         ...
 
+    def get_output_destinations(self, events_json: list[bytes]) -> list[OutputDestination]:
+        """Route a batch of output events to their destinations.
+
+        Args:
+            events_json: JSON-serialized CloudEvents (UTF-8 encoded).
+
+        Returns:
+            OutputDestination for each event, in input order.
+
+        Raises:
+            RuntimeError: If routing fails.
+        """
+        ...
+
     def load_routing_config(self, file_path: str) -> None:
         """Load routing configuration from a YAML file.
 
+        Also replaces the producer settings returned by get_kafka_config with
+        the file's `producer` section, or the core's defaults where it has none.
+
         Args:
             file_path: Path to the routing configuration YAML file.
 
@@ -0,0 +1,59 @@
+"""Build the out-of-line (API mode) cffi extension for the FFI core.
+
+Compiles ``eda_sdk.ffi._eda_core`` against the embedded library so that calls
+go through generated native wrappers rather than libffi. The loader falls back
+to ABI mode when the extension is not available.
+
+Usage:
+    python -m eda_sdk.ffi.build_ffi
+"""
+
+import platform
+import shutil
+import tempfile
+from pathlib import Path
+
+from cffi import FFI
+
+from .loader import _get_c_definitions, _header_path, get_embedded_lib_path
+
+_package_dir = Path(__file__).parent
+
+
+def build() -> str:
+    """Compile the extension module next to the loader.
+
+    Returns:
+        Path to the compiled extension module.
+
+    Raises:
+        RuntimeError: If the embedded library or header is missing.
+    """
+    lib_dir = get_embedded_lib_path().parent
+
+    # Resolve the embedded library relative to the extension at runtime
+    origin = "@loader_path" if platform.system() == "Darwin" else "$ORIGIN"
+    rpath = f"{origin}/{lib_dir.relative_to(_package_dir).as_posix()}"
+
+    ffibuilder = FFI()
+    ffibuilder.cdef(_get_c_definitions())
+    ffibuilder.set_source(
+        "eda_sdk.ffi._eda_core",
+        '#include "eda_core.h"',
+        include_dirs=[str(_header_path.parent)],
+        libraries=["eda_core"],
+        library_dirs=[str(lib_dir)],
+        extra_link_args=[f"-Wl,-rpath,{rpath}"],
+    )
+
+    # Keep generated C sources and objects out of the package tree
+    with tempfile.TemporaryDirectory(prefix="eda-ffi-build-") as tmpdir:
+        built = Path(ffibuilder.compile(tmpdir=tmpdir))
+        target = _package_dir / built.name
+        shutil.copy2(built, target)
+
+    return str(target)
+
+
+if __name__ == "__main__":
+    print(build())
@@ -1,6 +1,8 @@
 """FFI-based Core implementation using cffi."""
 
-from typing import Any, Optional
+import functools
+from collections.abc import Callable
+from typing import Any, ClassVar, Optional
 
 from ..types import DestinationType, KafkaConfig, OutputDestination
 from .loader import ffi, load_library
@@ -9,45 +11,180 @@ from .loader import ffi, load_library
 class FFICore:
     """Core implementation using FFI (cffi) to call Rust shared library."""
 
+    # Library functions cached as instance attributes (``_eda_*`` / ``_free``)
+    _free: Callable[..., Any]
+    _eda_should_retry: Callable[..., Any]
+    _eda_calculate_backoff: Callable[..., Any]
+    _eda_get_output_destination_n: Callable[..., Any]
+    _eda_free_output_destination: Callable[..., Any]
+    _eda_get_output_destinations: Callable[..., Any]
+    _eda_free_output_destinations: Callable[..., Any]
+    _BOUND_FUNCTIONS: ClassVar[dict[str, str]] = {
+        "_free": "eda_free_string",
+        "_eda_should_retry": "eda_should_retry",
+        "_eda_calculate_backoff": "eda_calculate_backoff",
+        "_eda_get_output_destination_n": "eda_get_output_destination_n",
+        "_eda_free_output_destination": "eda_free_output_destination",
+        "_eda_get_output_destinations": "eda_get_output_destinations",
+        "_eda_free_output_destinations": "eda_free_output_destinations",
+    }
+
+    # Bound on memoized retry results per instance
+    _RESULT_CACHE_SIZE = 1024
+
+    # Backoff saturates long before this attempt; later attempts reuse its value
+    _MAX_BACKOFF_ATTEMPT = 32
+
     def __init__(self) -> None:
         """Initialize the FFI core.
 
+        The native library is loaded on first use rather than here.
+        """
+        self._lib: Any = None
+        self._kafka_config: Optional[KafkaConfig] = None
+
+        # Destinations come from a small configured set, so one shared instance is
+        # kept per distinct (type, target, cluster) returned by the library
+        self._destinations: dict[tuple[int, bytes, Optional[bytes]], OutputDestination] = {}
+
+        # Cache hot cffi lookups
+        self._ffi_string = ffi.string
+        self._ffi_NULL = ffi.NULL
+
+        # Retry decisions are pure functions of their arguments (as documented on
+        # eda_should_retry), so repeated errors (e.g. during an error storm) skip the
+        # encode and FFI call
+        self._should_retry_cached = functools.lru_cache(maxsize=self._RESULT_CACHE_SIZE)(
+            self._should_retry_uncached
+        )
+
+        # Backoff per attempt, computed by the library on first use. This assumes
+        # backoff is deterministic; remove the table once the core adds jitter
+        # (see the TODO on calculate_backoff in core/src/retry.rs)
+        self._backoff_table: Optional[tuple[int, ...]] = None
+
+        self._unbind()
+
+    @property
+    def lib(self) -> Any:
+        """The native library handle, loaded on first access.
+
         Raises:
             RuntimeError: If library loading fails.
         """
-        self._lib: Any = load_library()
+        if self._lib is None:
+            self._bind(load_library())
+        return self._lib
+
+    def _bind(self, lib: Any) -> None:
+        """Cache the library handle and its hot functions on the instance.
+
+        Args:
+            lib: The loaded library handle.
+        """
+        for attr, name in self._BOUND_FUNCTIONS.items():
+            setattr(self, attr, getattr(lib, name))
+        self._lib = lib
+
+    def _unbind(self) -> None:
+        """Replace cached functions with stubs that load the library on first call."""
+        for attr, name in self._BOUND_FUNCTIONS.items():
+            setattr(self, attr, self._deferred(name))
+
+    def _deferred(self, name: str) -> Callable[..., Any]:
+        """Create a stub that loads the library, then forwards to the named function.
+
+        Args:
+            name: Library function name.
+
+        Returns:
+            Callable with the same arguments as the library function.
+        """
+
+        def call(*args: Any) -> Any:
+            return getattr(self.lib, name)(*args)
+
+        return call
+
+    def _take_str(self, ptr: Any) -> str:
+        """Decode a C string owned by the library and release it.
+
+        Args:
+            ptr: Non-NULL ``char *`` returned by the library.
+
+        Returns:
+            The decoded string.
+        """
+        return self._ffi_string(ffi.gc(ptr, self._free)).decode("utf-8")  # type: ignore[no-any-return]
 
     def get_kafka_config(self) -> KafkaConfig:
         """Retrieve the Kafka connection configuration.
 
+        The configuration is read from the library once and cached; use
+        ``reload_config`` to read it again.
+
+        Returns:
+            KafkaConfig with broker, topic, group, and producer settings.
+
+        Raises:
+            RuntimeError: If configuration cannot be retrieved.
+        """
+        if self._kafka_config is None:
+            self._kafka_config = self._read_kafka_config()
+        return self._kafka_config
+
+    def reload_config(self) -> KafkaConfig:
+        """Drop the cached Kafka configuration and read it again from the library.
+
+        Returns:
+            The freshly read KafkaConfig.
+
+        Raises:
+            RuntimeError: If configuration cannot be retrieved.
+        """
+        self._kafka_config = None
+        return self.get_kafka_config()
+
+    def _read_kafka_config(self) -> KafkaConfig:
+        """Read the Kafka connection configuration from the library.
+
         Returns:
-            KafkaConfig with broker, topic, and group settings.
+            KafkaConfig with broker, topic, group, and producer settings.
 
         Raises:
             RuntimeError: If configuration cannot be retrieved.
         """
-        # Get broker
-        broker_ptr = self._lib.eda_get_kafka_broker()
-        if broker_ptr == ffi.NULL:
+        broker_ptr = self.lib.eda_get_kafka_broker()
+        if broker_ptr == self._ffi_NULL:
             raise RuntimeError("Failed to get Kafka broker")
-        broker = ffi.string(broker_ptr).decode("utf-8")  # type: ignore[union-attr]
-        self._lib.eda_free_string(broker_ptr)
+        broker = self._take_str(broker_ptr)
 
-        # Get topic
-        topic_ptr = self._lib.eda_get_kafka_topic()
-        if topic_ptr == ffi.NULL:
+        topic_ptr = self.lib.eda_get_kafka_topic()
+        if topic_ptr == self._ffi_NULL:
             raise RuntimeError("Failed to get Kafka topic")
-        topic = ffi.string(topic_ptr).decode("utf-8")  # type: ignore[union-attr]
-        self._lib.eda_free_string(topic_ptr)
+        topic = self._take_str(topic_ptr)
 
-        # Get group
-        group_ptr = self._lib.eda_get_kafka_group()
-        if group_ptr == ffi.NULL:
+        group_ptr = self.lib.eda_get_kafka_group()
+        if group_ptr == self._ffi_NULL:
             raise RuntimeError("Failed to get Kafka group")
-        group = ffi.string(group_ptr).decode("utf-8")  # type: ignore[union-attr]
-        self._lib.eda_free_string(group_ptr)
+        group = self._take_str(group_ptr)
 
-        return KafkaConfig(broker=broker, topic=topic, group=group)
+        producer_ptr = self.lib.eda_get_producer_config()
+        if producer_ptr == self._ffi_NULL:
+            raise RuntimeError("Failed to get producer config")
+        try:
+            return KafkaConfig(
+                broker=broker,
+                topic=topic,
+                group=group,
+                linger_ms=producer_ptr.linger_ms,
+                compression_type=self._ffi_string(producer_ptr.compression_type).decode("utf-8"),
+                batch_size=producer_ptr.batch_size,
+                acks=self._ffi_string(producer_ptr.acks).decode("utf-8"),
+                queue_buffering_max_messages=producer_ptr.queue_buffering_max_messages,
+            )
+        finally:
+            self.lib.eda_free_producer_config(producer_ptr)
 
     def should_retry(self, error: str, attempt: int) -> bool:
         """Check if an error should be retried.
@@ -62,9 +199,13 @@ class FFICore:
         Raises:
             RuntimeError: If retry check fails.
         """
+        return self._should_retry_cached(error, attempt)
+
+    def _should_retry_uncached(self, error: str, attempt: int) -> bool:
+        """Call into the library for a retry decision (see ``should_retry``)."""
         error_bytes = error.encode("utf-8")
-        result = self._lib.eda_should_retry(error_bytes, attempt)
-        return bool(result)  # type: ignore[no-any-return]
+        result = self._eda_should_retry(error_bytes, attempt)
+        return bool(result)
 
     def calculate_backoff(self, attempt: int) -> int:
         """Calculate backoff duration in milliseconds.
@@ -76,16 +217,23 @@ class FFICore:
             Backoff duration in milliseconds.
 
         Raises:
+            ValueError: If attempt is negative.
             RuntimeError: If backoff calculation fails.
         """
-        result = self._lib.eda_calculate_backoff(attempt)
-        return int(result)
-
-    def get_output_destination(self, event_json: str) -> OutputDestination:
+        if attempt < 0:
+            raise ValueError(f"Attempt must not be negative: {attempt}")
+        table = self._backoff_table
+        if table is None:
+            table = self._backoff_table = tuple(
+                int(self._eda_calculate_backoff(i)) for i in range(self._MAX_BACKOFF_ATTEMPT + 1)
+            )
+        return table[min(attempt, self._MAX_BACKOFF_ATTEMPT)]
+
+    def get_output_destination(self, event_json: bytes) -> OutputDestination:
         """Route an output event to its destination.
 
         Args:
-            event_json: JSON-serialized CloudEvent.
+            event_json: JSON-serialized CloudEvent (UTF-8 encoded).
 
         Returns:
             OutputDestination specifying where to send the event.
@@ -93,28 +241,72 @@ class FFICore:
         Raises:
             RuntimeError: If routing fails.
         """
-        event_bytes = event_json.encode("utf-8")
-        dest_ptr = self._lib.eda_get_output_destination(event_bytes)
-        if dest_ptr == ffi.NULL:
+        # cffi passes the bytes' own buffer; the length spares the library a NUL scan
+        dest_ptr = self._eda_get_output_destination_n(event_json, len(event_json))
+        if dest_ptr == self._ffi_NULL:
             raise RuntimeError("Failed to get output destination")
+        # Released by the library once the wrapper goes out of scope
+        dest_ptr = ffi.gc(dest_ptr, self._eda_free_output_destination)
 
-        try:
-            # Extract destination type
-            dest_type = DestinationType(dest_ptr.dest_type)
+        return self._read_destination(dest_ptr)
+
+    def get_output_destinations(self, events_json: list[bytes]) -> list[OutputDestination]:
+        """Route a batch of output events with a single call into the library.
+
+        Args:
+            events_json: JSON-serialized CloudEvents (UTF-8 encoded).
 
-            # Extract target string
-            if dest_ptr.target == ffi.NULL:
-                raise RuntimeError("Destination target is NULL")
-            target = ffi.string(dest_ptr.target).decode("utf-8")  # type: ignore[union-attr]
+        Returns:
+            OutputDestination for each event, in input order.
+
+        Raises:
+            RuntimeError: If routing fails.
+        """
+        count = len(events_json)
+        if count == 0:
+            return []
 
-            # Extract cluster string (optional)
-            cluster: Optional[str] = None
-            if dest_ptr.cluster != ffi.NULL:
-                cluster = ffi.string(dest_ptr.cluster).decode("utf-8")  # type: ignore[union-attr]
+        # JSON never contains a raw record separator, so it safely delimits events
+        dests_ptr = self._eda_get_output_destinations(b"\x1e".join(events_json), count)
+        if dests_ptr == self._ffi_NULL:
+            raise RuntimeError("Failed to get output destinations")
 
-            return OutputDestination(type=dest_type, target=target, cluster=cluster)
+        try:
+            return [self._read_destination(dests_ptr[i]) for i in range(count)]
         finally:
-            self._lib.eda_free_output_destination(dest_ptr)
+            self._eda_free_output_destinations(dests_ptr, count)
+
+    def _read_destination(self, dest: Any) -> OutputDestination:
+        """Get the OutputDestination for a ``COutputDestination`` owned by the library.
+
+        Args:
+            dest: ``COutputDestination`` pointer or struct returned by the library.
+
+        Returns:
+            The equivalent OutputDestination, shared with earlier identical results.
+
+        Raises:
+            RuntimeError: If the destination target is NULL.
+        """
+        if dest.target == self._ffi_NULL:
+            raise RuntimeError("Destination target is NULL")
+
+        # Look up by the raw values, decoding only destinations not seen before
+        cluster_ptr = dest.cluster
+        key = (
+            dest.dest_type,
+            self._ffi_string(dest.target),
+            None if cluster_ptr == self._ffi_NULL else self._ffi_string(cluster_ptr),
+        )
+        destination = self._destinations.get(key)
+        if destination is None:
+            dest_type, target, cluster = key
+            destination = self._destinations[key] = OutputDestination(
+                type=DestinationType(dest_type),
+                target=target.decode("utf-8"),
+                cluster=cluster.decode("utf-8") if cluster is not None else None,
+            )
+        return destination
 
     def load_routing_config(self, file_path: str) -> None:
         """Load routing configuration from a YAML file.
@@ -126,10 +318,19 @@ class FFICore:
             RuntimeError: If loading fails.
         """
         path_bytes = file_path.encode("utf-8")
-        success = self._lib.eda_load_routing_config(path_bytes)
+        success = self.lib.eda_load_routing_config(path_bytes)
         if not success:
             raise RuntimeError(f"Failed to load routing config from {file_path}")
 
+        # Drop destinations and producer settings of the previous configuration
+        self._destinations.clear()
+        self._kafka_config = None
+
     def close(self) -> None:
-        """Release resources (no-op for FFI implementation)."""
-        pass
+        """Release this instance's library handle.
+
+        The library itself stays loaded for the process (its routing state is
+        process-wide), so a later call simply re-binds the shared handle.
+        """
+        self._lib = None
+        self._unbind()
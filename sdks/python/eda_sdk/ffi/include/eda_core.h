@@ -21,6 +21,15 @@ typedef struct COutputDestination {
   char *cluster;
 } COutputDestination;
 
+// FFI-compatible producer configuration structure
+typedef struct CProducerConfig {
+  uint32_t linger_ms;
+  uint32_t batch_size;
+  uint32_t queue_buffering_max_messages;
+  char *compression_type;
+  char *acks;
+} CProducerConfig;
+
 #ifdef __cplusplus
 extern "C" {
 #endif // __cplusplus
@@ -40,18 +49,42 @@ char *eda_get_kafka_group(void);
 // FFI-compatible function to free C strings returned by this library
 void eda_free_string(char *s);
 
+// FFI-compatible function to get producer configuration
+// Returns a structure that must be freed with `eda_free_producer_config`
+CProducerConfig *eda_get_producer_config(void);
+
+// FFI-compatible function to free producer configuration returned by this library
+void eda_free_producer_config(CProducerConfig *config);
+
 uint32_t eda_classify_error(const char *error);
 
 uint64_t eda_get_retry_decision(uint32_t error_category, uint32_t attempt, uint32_t max_attempts);
 
+// Must stay a pure function of `(error, attempt)`: the Python SDK memoizes its
+// results (`FFICore.should_retry`), so state-dependent decisions need that cache removed
 int32_t eda_should_retry(const char *error, uint32_t attempt);
 
 uint64_t eda_calculate_backoff(uint32_t attempt);
 
 struct COutputDestination *eda_get_output_destination(const char *event_json);
 
+// Route an event given as a UTF-8 buffer and its length
+//
+// Same as `eda_get_output_destination`, but the buffer needs no NUL terminator.
+struct COutputDestination *eda_get_output_destination_n(const char *event_json, uintptr_t len);
+
 void eda_free_output_destination(struct COutputDestination *dest);
 
+// Route a batch of events in a single FFI call
+//
+// `events_json` holds `count` JSON-serialized events separated by 0x1E. Returns an array of
+// `count` destinations in input order, to be freed with `eda_free_output_destinations`,
+// or null if the input is invalid.
+struct COutputDestination *eda_get_output_destinations(const char *events_json, uintptr_t count);
+
+// Free an array returned by `eda_get_output_destinations`
+void eda_free_output_destinations(struct COutputDestination *dests, uintptr_t count);
+
 // Load routing configuration from a YAML file via FFI
 bool eda_load_routing_config(const char *file_path);
 
@@ -10,12 +10,12 @@ from typing import Any, Optional
 
 from cffi import FFI
 
-# Define the C interface from the bundled header file
-ffi = FFI()
-
 # Path to the bundled header file (copied during build)
 _header_path = Path(__file__).parent / "include" / "eda_core.h"
 
+# Processed definitions cached next to the header, keyed by header mtime
+_cdef_cache_path = _header_path.with_suffix(".cdef.cache")
+
 
 def _load_c_definitions() -> str:
     """Load C definitions from the bundled header file.
@@ -87,7 +87,55 @@ def _load_c_definitions() -> str:
     return "\n".join(lines)
 
 
-ffi.cdef(_load_c_definitions())
+def _get_c_definitions() -> str:
+    """Get C definitions, reusing the on-disk cache while the header is unchanged.
+
+    Returns:
+        C definitions suitable for cffi.cdef().
+
+    Raises:
+        RuntimeError: If header file not found.
+    """
+    try:
+        header_mtime = str(_header_path.stat().st_mtime_ns)
+    except OSError:
+        # Let the parser report the missing header
+        return _load_c_definitions()
+
+    try:
+        cached_mtime, _, cdef = _cdef_cache_path.read_text().partition("\n")
+        if cached_mtime == header_mtime:
+            return cdef
+    except OSError:
+        pass  # No cache yet
+
+    cdef = _load_c_definitions()
+
+    # Write atomically so concurrent processes never read a partial cache
+    tmp_path = _cdef_cache_path.with_name(f"{_cdef_cache_path.name}.{os.getpid()}")
+    try:
+        tmp_path.write_text(f"{header_mtime}\n{cdef}")
+        os.replace(tmp_path, _cdef_cache_path)
+    except OSError:
+        # Read-only install, parse again next time
+        tmp_path.unlink(missing_ok=True)
+
+    return cdef
+
+
+# Prefer the compiled out-of-line (API mode) extension built by build_ffi.py;
+# it calls into the library through native wrappers instead of libffi.
+# Fall back to in-line ABI mode when it has not been built for this platform.
+ffi: Any
+_api_lib: Any
+try:
+    from ._eda_core import ffi  # type: ignore[import-not-found,no-redef]
+    from ._eda_core import lib as _api_lib  # type: ignore[import-not-found,no-redef]
+except ImportError:
+    # Define the C interface from the bundled header file
+    ffi = FFI()
+    ffi.cdef(_get_c_definitions())
+    _api_lib = None
 
 # Global library handle
 _lib: Any = None
@@ -160,6 +208,9 @@ def get_embedded_lib_path() -> Path:
 def extract_embedded_lib() -> str:
     """Extract the embedded library to a temporary directory.
 
+    This is the slow path used only when the library cannot be loaded in place
+    (e.g. the package lives in a zip archive or a noexec mount).
+
     Returns:
         Path to the extracted library file.
 
@@ -203,6 +254,19 @@ def load_library() -> Any:
     if _lib is not None:
         return _lib
 
+    # Compiled extension already links against the embedded library
+    if _api_lib is not None:
+        _lib = _api_lib
+        return _lib
+
+    # Load the embedded library in place, avoiding a copy on every start
+    embedded_lib_path = str(get_embedded_lib_path())
+    try:
+        _lib = ffi.dlopen(embedded_lib_path)
+        return _lib
+    except OSError:
+        pass  # Not loadable in place, fall back to extracting a copy
+
     # Extract embedded library to temp file
     lib_path = extract_embedded_lib()
 
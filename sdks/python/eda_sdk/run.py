@@ -1,10 +1,11 @@
 """Main run function for EDA SDK."""
 
-import inspect
+import functools
 import logging
 import signal
 import sys
 from pathlib import Path
+from types import FrameType
 from typing import Optional
 
 from .consumer import Consumer, Handler
@@ -58,18 +59,24 @@ def run_with_core(core: Core, handler: Handler) -> None:
         raise
 
 
+@functools.lru_cache(maxsize=1)
 def _get_caller_directory() -> Optional[Path]:
     """Get the directory of the caller's script.
 
+    The result is computed once per process.
+
     Returns:
         Path to the caller's directory, or None if not found.
     """
-    # Walk up the call stack to find the first caller outside the SDK
-    for frame_info in inspect.stack():
-        frame_path = Path(frame_info.filename)
+    # Walk up the call stack to find the first caller outside the SDK.
+    # Only code filenames are read; inspect.stack() would also load source lines.
+    frame: Optional[FrameType] = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
         # Skip SDK internal files
-        if "eda_sdk" not in str(frame_path):
-            return frame_path.parent
+        if "eda_sdk" not in filename:
+            return Path(filename).parent
+        frame = frame.f_back
 
     return None
 
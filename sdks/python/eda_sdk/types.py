@@ -16,16 +16,25 @@ class DestinationType(IntEnum):
 
 @dataclass
 class KafkaConfig:
-    """Kafka connection configuration."""
+    """Kafka connection configuration, with producer settings for output events.
+
+    Producer settings have no defaults here: the core is their single source,
+    falling back to its own defaults when the routing config does not set them.
+    """
 
     broker: str
     topic: str
     group: str
+    linger_ms: int
+    compression_type: str
+    batch_size: int
+    acks: str
+    queue_buffering_max_messages: int
 
 
-@dataclass
+@dataclass(frozen=True)
 class OutputDestination:
-    """Output destination for routing events."""
+    """Output destination for routing events (immutable, instances may be shared)."""
 
     type: DestinationType
     target: str
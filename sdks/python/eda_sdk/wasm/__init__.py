@@ -4,7 +4,21 @@ Note: Full WASM Component Model support in Python is still evolving.
 This is a placeholder for future implementation.
 """
 
-from .core import WASMCore
+from typing import Any
+
 from .run import run
 
-__all__ = ["WASMCore", "run"]
+__all__ = ["run"]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``WASMCore`` lazily from the placeholder core module (PEP 562).
+
+    Raises:
+        NotImplementedError: WASM support not yet implemented.
+    """
+    if name == "WASMCore":
+        from . import core
+
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
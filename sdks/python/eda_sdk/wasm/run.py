@@ -1,9 +1,12 @@
 """Main run function for WASM-based EDA functions (placeholder)."""
 
-from ..consumer import Handler
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from ..consumer import Handler
 
-def run(handler: Handler) -> None:
+
+def run(handler: "Handler") -> None:
     """Start the EDA consumer using WASM core with the given handler.
 
     Note: WASM support is not yet implemented in the Python SDK.
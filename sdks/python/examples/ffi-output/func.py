@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """FFI output example - demonstrates output event routing."""
 
+import os
+import sys
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -8,39 +10,57 @@ from cloudevents.http import CloudEvent
 
 from eda_sdk.ffi import run
 
+# Prefix of output event ids (the input event id follows)
+_PREFIX = "processed-"
+
+# Fields shared by every output event
+_ATTRIBUTES_TEMPLATE = {
+    "specversion": "1.0",
+    "type": "com.example.processed",
+    "source": "ffi-output-example",
+}
+_DATA_TEMPLATE = {"message": "Event processed successfully"}
+
+# Set LOG_EVENTS=0 to handle events without any console output
+LOG_EVENTS = os.environ.get("LOG_EVENTS", "1") != "0"
+
 
 def handle(event: CloudEvent) -> Optional[CloudEvent]:
     """Handle incoming CloudEvents and produce output events.
 
     This demonstrates the output event routing capability.
     """
-    print(f"📨 Received event: {event['id']}")
-    print(f"   Type: {event['type']}")
-    print(f"   Source: {event['source']}")
+    if LOG_EVENTS:
+        # One write per event rather than a print per line
+        sys.stdout.write(
+            f"📨 Received event: {event['id']}\n"
+            f"   Type: {event['type']}\n"
+            f"   Source: {event['source']}\n"
+        )
 
     # Only process events of type "eda-mlang-test"
     # Return None for other types (no output event)
     if event["type"] != "eda-mlang-test":
         return None
 
-    # Create an output event
+    # One timestamp for the whole output event
+    now_iso = datetime.now(timezone.utc).isoformat()
+
+    # Create an output event from the templates, filling in per-event fields
     output_event = CloudEvent(
-        {
-            "specversion": "1.0",
-            "type": "com.example.processed",
-            "source": "ffi-output-example",
-            "id": f"processed-{event['id']}",
-            "time": datetime.now(timezone.utc).isoformat(),
-        },
+        {**_ATTRIBUTES_TEMPLATE, "id": _PREFIX + event["id"], "time": now_iso},
         data={
+            **_DATA_TEMPLATE,
             "original_id": event["id"],
             "original_type": event["type"],
-            "processed_at": datetime.now(timezone.utc).isoformat(),
-            "message": "Event processed successfully",
+            "processed_at": now_iso,
         },
     )
 
-    print(f"✅ Producing output event: {output_event['id']} (type: {output_event['type']})")
+    if LOG_EVENTS:
+        sys.stdout.write(
+            f"✅ Producing output event: {output_event['id']} (type: {output_event['type']})\n"
+        )
 
     return output_event
 
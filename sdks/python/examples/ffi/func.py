@@ -1,19 +1,29 @@
 #!/usr/bin/env python3
 """Simple FFI example - demonstrates basic event handling."""
 
+import os
+import sys
+
 from cloudevents.http import CloudEvent
 
 from eda_sdk.ffi import run
 
+# Set LOG_EVENTS=0 to handle events without any console output
+LOG_EVENTS = os.environ.get("LOG_EVENTS", "1") != "0"
+
 
 def handle(event: CloudEvent) -> None:
     """Handle incoming CloudEvents.
 
     This is what a developer would write for their EDA function.
     """
-    print(f"📨 Received event: {event['id']}")
-    print(f"   Type: {event['type']}")
-    print(f"   Source: {event['source']}")
+    if LOG_EVENTS:
+        # One write per event rather than a print per line
+        sys.stdout.write(
+            f"📨 Received event: {event['id']}\n"
+            f"   Type: {event['type']}\n"
+            f"   Source: {event['source']}\n"
+        )
 
     # User's business logic would go here
     # For this example, we just log the event
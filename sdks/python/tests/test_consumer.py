@@ -0,0 +1,408 @@
+"""Unit tests for the Kafka consumer."""
+
+from typing import Any, Optional
+
+import pytest
+from cloudevents.http import CloudEvent
+
+from eda_sdk import consumer as consumer_module
+from eda_sdk.consumer import Consumer
+from eda_sdk.types import DestinationType, KafkaConfig, OutputDestination
+
+
+class FakeCore:
+    """Core stand-in that routes every output event to one Kafka topic."""
+
+    def __init__(self) -> None:
+        self.retry_checks: list[str] = []
+        self.routing_error: Optional[Exception] = None
+
+    def get_kafka_config(self) -> KafkaConfig:
+        return KafkaConfig(
+            broker="localhost:9092",
+            topic="events",
+            group="test",
+            linger_ms=10,
+            compression_type="snappy",
+            batch_size=65536,
+            acks="all",
+            queue_buffering_max_messages=1_000_000,
+        )
+
+    def should_retry(self, error: str, attempt: int) -> bool:
+        self.retry_checks.append(error)
+        return False
+
+    def calculate_backoff(self, attempt: int) -> int:
+        return 0
+
+    def get_output_destinations(self, events_json: list[bytes]) -> list[OutputDestination]:
+        if self.routing_error is not None:
+            raise self.routing_error
+        return [OutputDestination(type=DestinationType.KAFKA, target="out")] * len(events_json)
+
+    def close(self) -> None:
+        pass
+
+
+class FakeKafkaConsumer:
+    """confluent_kafka.Consumer stand-in recording stored offsets and commits."""
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        self.closed = False
+        self.batches: list[list[Any]] = []
+        self.stored: list[Any] = []
+        self.commits: list[bool] = []
+
+    def consume(self, num_messages: int, timeout: float) -> list[Any]:
+        # Stop start() once all batches are consumed
+        if not self.batches:
+            raise KeyboardInterrupt
+        return self.batches.pop(0)
+
+    def subscribe(self, topics: list[str]) -> None:
+        pass
+
+    def store_offsets(self, message: Any) -> None:
+        self.stored.append(message)
+
+    def commit(self, asynchronous: bool = True) -> None:
+        # Same failure as confluent_kafka on a closed consumer
+        if self.closed:
+            raise RuntimeError("Consumer closed")
+        self.commits.append(asynchronous)
+
+    def close(self) -> None:
+        if self.closed:
+            raise RuntimeError("Consumer closed")
+        self.closed = True
+
+
+class FakeProducer:
+    """confluent_kafka.Producer stand-in recording produced messages.
+
+    Queued messages are reported delivered on flush(), except those whose key is
+    in ``failing_keys`` (reported failed) or ``stuck_keys`` (never reported).
+    """
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        self.produced: list[dict[str, Any]] = []
+        self.queued: list[dict[str, Any]] = []
+        self.failing_keys: set[bytes] = set()
+        self.stuck_keys: set[bytes] = set()
+        self.flushes = 0
+
+    def produce(self, **kwargs: Any) -> None:
+        self.produced.append(kwargs)
+        self.queued.append(kwargs)
+
+    def poll(self, timeout: float) -> int:
+        return 0
+
+    def flush(self, timeout: Optional[float] = None) -> int:
+        self.flushes += 1
+        queued, self.queued = self.queued, []
+        for kwargs in queued:
+            if kwargs["key"] in self.stuck_keys:
+                self.queued.append(kwargs)
+                continue
+            err = "delivery failed" if kwargs["key"] in self.failing_keys else None
+            kwargs["on_delivery"](err, FakeMessage(kwargs["value"]))
+        return len(self.queued)
+
+
+class FakeMessage:
+    """confluent_kafka.Message stand-in for a consumed record."""
+
+    def __init__(
+        self,
+        value: Optional[bytes],
+        headers: Optional[list[tuple[str, bytes]]] = None,
+        key: Optional[bytes] = None,
+        partition: int = 0,
+        offset: int = 0,
+    ) -> None:
+        self._value = value
+        self._headers = headers
+        self._key = key
+        self._partition = partition
+        self._offset = offset
+
+    def value(self) -> Optional[bytes]:
+        return self._value
+
+    def headers(self) -> Optional[list[tuple[str, bytes]]]:
+        return self._headers
+
+    def key(self) -> Optional[bytes]:
+        return self._key
+
+    def topic(self) -> str:
+        return "events"
+
+    def partition(self) -> int:
+        return self._partition
+
+    def offset(self) -> int:
+        return self._offset
+
+    def error(self) -> None:
+        return None
+
+
+def structured_message(event_id: str, offset: int = 0, partition: int = 0) -> FakeMessage:
+    """Create a structured-mode message carrying a minimal CloudEvent."""
+    value = f'{{"specversion":"1.0","type":"test","source":"test","id":"{event_id}"}}'
+    return FakeMessage(value.encode(), partition=partition, offset=offset)
+
+
+@pytest.fixture(autouse=True)
+def fake_kafka(monkeypatch):
+    """Replace the Kafka client classes used by the consumer with fakes."""
+    monkeypatch.setattr(consumer_module, "KafkaConsumer", FakeKafkaConsumer)
+    monkeypatch.setattr(consumer_module, "Producer", FakeProducer)
+
+
+def simple_handler(event: CloudEvent) -> None:
+    pass
+
+
+def output_handler(event: CloudEvent) -> Optional[CloudEvent]:
+    return CloudEvent({"type": "out", "source": "test", "id": f"out-{event['id']}"})
+
+
+def test_consumer_close_twice():
+    """Test that close() can be called again, as on signal-triggered shutdown."""
+    consumer = Consumer(FakeCore(), output_handler, workers=2)
+    kafka_consumer = consumer._consumer
+
+    consumer.close()
+    consumer.close()  # Should not raise any exceptions
+
+    assert kafka_consumer.closed
+    assert kafka_consumer.commits == [False]
+
+
+def test_publish_output_events_isolates_serialization_errors():
+    """Test that an event that cannot be serialized does not stop the rest of the batch."""
+    core = FakeCore()
+    consumer = Consumer(core, output_handler)
+    events = [
+        CloudEvent({"type": "out", "source": "test", "id": "1"}),
+        CloudEvent({"type": "out", "source": "test", "id": "2"}, data={"n": 2**64}),
+        CloudEvent({"type": "out", "source": "test", "id": "3"}),
+    ]
+
+    published = consumer._publish_output_events(events, [FakeMessage(b"") for _ in events])
+
+    assert published == [True, False, True]
+    assert [m["key"] for m in consumer._producer.produced] == [b"1", b"3"]
+    assert len(core.retry_checks) == 1
+
+
+def test_publish_output_events_routing_error():
+    """Test that a routing failure goes through the handler error path for each event."""
+    core = FakeCore()
+    core.routing_error = RuntimeError("Failed to get output destinations")
+    consumer = Consumer(core, output_handler)
+    events = [CloudEvent({"type": "out", "source": "test", "id": str(i)}) for i in range(2)]
+
+    published = consumer._publish_output_events(events, [FakeMessage(b"") for _ in events])
+
+    assert published == [False, False]
+    assert consumer._producer.produced == []
+    assert core.retry_checks == ["Failed to get output destinations"] * 2
+
+
+def test_process_messages_survives_unserializable_output():
+    """Test that one unserializable output event only holds back its own message."""
+
+    def handler(event: CloudEvent) -> Optional[CloudEvent]:
+        data = {"n": 2**64} if event["id"] == "2" else None
+        return CloudEvent({"type": "out", "source": "test", "id": event["id"]}, data=data)
+
+    consumer = Consumer(FakeCore(), handler)
+    msgs = [structured_message(str(i), offset=i) for i in range(1, 4)]
+
+    done = consumer._process_messages(msgs)
+
+    assert done == [msgs[0], msgs[2]]
+
+
+def test_start_flushes_outputs_before_commit():
+    """Test that output events are delivered before their input offsets are stored."""
+    consumer = Consumer(FakeCore(), output_handler)
+    kafka_consumer = consumer._consumer
+    producer = consumer._producer
+    msgs = [structured_message(str(i), offset=i) for i in range(3)]
+    kafka_consumer.batches = [msgs]
+
+    stored_at_flush = []
+    flush = producer.flush
+
+    def recording_flush(timeout=None):
+        stored_at_flush.append(len(kafka_consumer.stored))
+        return flush(timeout)
+
+    producer.flush = recording_flush
+
+    consumer.start()
+
+    assert stored_at_flush[0] == 0
+    assert kafka_consumer.stored == msgs
+    assert kafka_consumer.commits == [True, False]
+    assert len(producer.produced) == 3
+
+
+def test_start_skips_inputs_with_undelivered_outputs():
+    """Test that inputs whose output failed or timed out delivery are not stored."""
+    consumer = Consumer(FakeCore(), output_handler)
+    kafka_consumer = consumer._consumer
+    producer = consumer._producer
+    producer.failing_keys = {b"out-1"}
+    producer.stuck_keys = {b"out-2"}
+    msgs = [structured_message(str(i), offset=i) for i in range(4)]
+    kafka_consumer.batches = [msgs]
+
+    consumer.start()
+
+    assert kafka_consumer.stored == [msgs[0], msgs[3]]
+
+
+def test_publish_output_events_non_str_keys():
+    """Test that data with non-str dict keys is serialized like json.dumps does."""
+    consumer = Consumer(FakeCore(), output_handler)
+    event = CloudEvent({"type": "out", "source": "test", "id": "1"}, data={1: "a"})
+
+    assert consumer._publish_output_events([event], [FakeMessage(b"")]) == [True]
+    assert b'"data":{"1":"a"}' in consumer._producer.produced[0]["value"]
+
+
+def test_parse_structured_event():
+    """Test parsing a structured-mode message, with the key as partitionkey."""
+    consumer = Consumer(FakeCore(), simple_handler)
+    msg = FakeMessage(
+        b'{"specversion":"1.0","type":"test","source":"test","id":"1","data":{"a":1}}',
+        key=b"k",
+    )
+
+    event = consumer._parse_cloud_event(msg)
+
+    assert event["id"] == "1"
+    assert event["partitionkey"] == b"k"
+    assert event.data == {"a": 1}
+
+
+def test_parse_structured_event_keeps_partitionkey():
+    """Test that a partitionkey in the envelope takes precedence over the message key."""
+    consumer = Consumer(FakeCore(), simple_handler)
+    msg = FakeMessage(
+        b'{"specversion":"1.0","type":"test","source":"test","id":"1","partitionkey":"p"}',
+        key=b"k",
+    )
+
+    event = consumer._parse_cloud_event(msg)
+
+    assert event["partitionkey"] == "p"
+
+
+def test_parse_structured_event_data_base64():
+    """Test that data_base64 is decoded to bytes."""
+    consumer = Consumer(FakeCore(), simple_handler)
+    msg = FakeMessage(
+        b'{"specversion":"1.0","type":"test","source":"test","id":"1","data_base64":"aGk="}'
+    )
+
+    event = consumer._parse_cloud_event(msg)
+
+    assert event.data == b"hi"
+    assert "data_base64" not in event.get_attributes()
+
+
+def test_parse_binary_event():
+    """Test parsing a binary-mode message from ce_* and content-type headers."""
+    consumer = Consumer(FakeCore(), simple_handler)
+    msg = FakeMessage(
+        b'{"a":1}',
+        headers=[
+            ("ce_specversion", b"1.0"),
+            ("ce_type", b"test"),
+            ("ce_source", b"test"),
+            ("ce_id", b"1"),
+            ("content-type", b"application/json"),
+            ("other", b"ignored"),
+        ],
+        key=b"k",
+    )
+
+    event = consumer._parse_cloud_event(msg)
+
+    assert event["type"] == "test"
+    assert event["id"] == "1"
+    assert event["datacontenttype"] == "application/json"
+    assert event["partitionkey"] == b"k"
+    assert "other" not in event.get_attributes()
+    assert event.data == {"a": 1}
+
+
+def test_parse_event_without_ce_headers():
+    """Test that a message that is neither structured nor binary mode is skipped."""
+    consumer = Consumer(FakeCore(), simple_handler)
+
+    assert consumer._parse_cloud_event(FakeMessage(b'{"a":1}')) is None
+    assert consumer._parse_cloud_event(FakeMessage(b"[1]", headers=[("x", b"y")])) is None
+    assert consumer._parse_cloud_event(FakeMessage(b"not json")) is None
+    assert consumer._parse_cloud_event(FakeMessage(None)) is None
+
+
+def test_process_messages_commit_selection():
+    """Test that only handled messages are returned, in input order."""
+    core = FakeCore()
+
+    def handler(event: CloudEvent) -> None:
+        if event["id"] == "2":
+            raise ValueError("boom")
+
+    consumer = Consumer(core, handler)
+    msgs = [structured_message(str(i), offset=i) for i in range(4)]
+    msgs.insert(1, FakeMessage(b"not json", offset=99))
+
+    done = consumer._process_messages(msgs)
+
+    assert done == [msgs[0], msgs[2], msgs[4]]
+    assert core.retry_checks == ["boom"]
+
+
+def test_process_messages_without_output():
+    """Test that messages whose handler returns no output event are committed."""
+
+    def handler(event: CloudEvent) -> Optional[CloudEvent]:
+        return None if event["id"] == "1" else output_handler(event)
+
+    consumer = Consumer(FakeCore(), handler)
+    msgs = [structured_message(str(i), offset=i) for i in range(3)]
+
+    done = consumer._process_messages(msgs)
+
+    assert done == msgs
+    assert [m["key"] for m in consumer._producer.produced] == [b"out-0", b"out-2"]
+
+
+def test_start_with_workers_keeps_partition_order():
+    """Test that the worker pool handles each partition's messages in order."""
+    seen: list[str] = []
+
+    def handler(event: CloudEvent) -> None:
+        seen.append(event["id"])
+
+    consumer = Consumer(FakeCore(), handler, workers=2)
+    kafka_consumer = consumer._consumer
+    msgs = [structured_message(str(i), offset=i, partition=i % 2) for i in range(6)]
+    kafka_consumer.batches = [msgs]
+
+    consumer.start()
+
+    assert sorted(kafka_consumer.stored, key=lambda m: m.offset()) == msgs
+    assert [event_id for event_id in seen if int(event_id) % 2 == 0] == ["0", "2", "4"]
+    assert [event_id for event_id in seen if int(event_id) % 2 == 1] == ["1", "3", "5"]
+    assert kafka_consumer.commits == [True, False]
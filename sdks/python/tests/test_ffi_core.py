@@ -2,13 +2,24 @@
 
 import pytest
 from eda_sdk.ffi.core import FFICore
-from eda_sdk.types import KafkaConfig
+from eda_sdk.types import DestinationType, KafkaConfig, OutputDestination
 
 
 def test_ffi_core_construction():
-    """Test that FFICore can be constructed."""
+    """Test that FFICore can be constructed without loading the library."""
     core = FFICore()
     assert core is not None
+    assert core._lib is None
+    assert core.lib is not None
+
+
+def test_ffi_core_lazy_load_on_first_call():
+    """Test that the first FFI call loads the library."""
+    core = FFICore()
+    assert core._lib is None
+
+    core.calculate_backoff(1)
+
     assert core._lib is not None
 
 
@@ -26,6 +37,31 @@ def test_ffi_core_get_kafka_config():
     assert len(config.group) > 0
 
 
+def test_ffi_core_get_kafka_config_producer_settings():
+    """Test that the configuration carries producer settings from the library."""
+    core = FFICore()
+    config = core.get_kafka_config()
+
+    assert config.linger_ms >= 0
+    assert config.batch_size > 0
+    assert config.compression_type
+    assert config.acks
+    assert config.queue_buffering_max_messages > 0
+
+
+def test_ffi_core_get_kafka_config_is_cached():
+    """Test that the configuration is read once until reloaded."""
+    core = FFICore()
+    config = core.get_kafka_config()
+
+    assert core.get_kafka_config() is config
+
+    reloaded = core.reload_config()
+    assert reloaded is not config
+    assert reloaded == config
+    assert core.get_kafka_config() is reloaded
+
+
 def test_ffi_core_calculate_backoff():
     """Test backoff calculation."""
     core = FFICore()
@@ -43,6 +79,71 @@ def test_ffi_core_calculate_backoff():
     assert backoff3 >= 0
 
 
+def test_ffi_core_calculate_backoff_uses_table():
+    """Test that backoffs come from a table built on first use."""
+    core = FFICore()
+    assert core._backoff_table is None
+
+    backoff = core.calculate_backoff(1)
+
+    assert core._backoff_table is not None
+    assert backoff == core._backoff_table[1]
+    assert core.calculate_backoff(1000) == core._backoff_table[-1]
+
+    with pytest.raises(ValueError):
+        core.calculate_backoff(-1)
+
+
+def test_ffi_core_should_retry_is_memoized():
+    """Test that repeated retry checks reuse the cached result."""
+    core = FFICore()
+
+    first = core.should_retry("connection refused", 1)
+    second = core.should_retry("connection refused", 1)
+
+    assert isinstance(first, bool)
+    assert first == second
+    info = core._should_retry_cached.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_ffi_core_get_output_destination():
+    """Test routing a serialized event passed as bytes."""
+    core = FFICore()
+    event_json = b'{"specversion":"1.0","type":"test","source":"test","id":"1"}'
+
+    dest = core.get_output_destination(event_json)
+
+    assert isinstance(dest, OutputDestination)
+    assert isinstance(dest.type, DestinationType)
+    assert isinstance(dest.target, str)
+
+
+def test_ffi_core_get_output_destination_is_shared():
+    """Test that identical routing results reuse one OutputDestination."""
+    core = FFICore()
+    first = core.get_output_destination(b'{"specversion":"1.0","type":"a","source":"s","id":"1"}')
+    second = core.get_output_destination(b'{"specversion":"1.0","type":"a","source":"s","id":"2"}')
+
+    assert second is first
+
+
+def test_ffi_core_get_output_destinations():
+    """Test routing a batch of events in one call."""
+    core = FFICore()
+    events_json = [
+        b'{"specversion":"1.0","type":"test","source":"test","id":"1"}',
+        b'{"specversion":"1.0","type":"test","source":"test","id":"2"}',
+    ]
+
+    dests = core.get_output_destinations(events_json)
+
+    assert len(dests) == 2
+    assert dests == [core.get_output_destination(event_json) for event_json in events_json]
+    assert core.get_output_destinations([]) == []
+
+
 def test_ffi_core_close():
     """Test that close() can be called without errors."""
     core = FFICore()
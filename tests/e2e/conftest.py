@@ -1,6 +1,7 @@
 """Pytest fixtures for e2e tests."""
 
 import os
+import shutil
 import subprocess
 import pytest
 from pathlib import Path
@@ -9,31 +10,160 @@ from pathlib import Path
 ROOT_DIR = Path(__file__).parent.parent.parent
 os.chdir(ROOT_DIR)
 
+# Embedded core libraries the examples run against
+BUILD_ARTIFACTS = ["sdks/python/eda_sdk/ffi/libs/*/*eda_core.*", "sdks/go/pkg/ffi/libs/*/*eda_core.*"]
+
+# Inputs of `make build`: core and bindings, both SDKs, and the makefiles driving them
+BUILD_SOURCES = [
+    "Makefile",
+    "common.mk",
+    "core/Makefile",
+    "core/Cargo.toml",
+    "core/src/**/*.rs",
+    "bindings/*/Cargo.toml",
+    "bindings/*/src/**/*.rs",
+    "bindings/ffi/cbindgen.toml",
+    "wit/**/*.wit",
+    "sdks/go/Makefile",
+    "sdks/go/go.mod",
+    "sdks/go/go.sum",
+    "sdks/go/**/*.go",
+    "sdks/python/Makefile",
+    "sdks/python/pyproject.toml",
+    "sdks/python/eda_sdk/**/*.py",
+    "sdks/python/eda_sdk/ffi/include/eda_core.h",
+]
+
+# Touched after every successful `make build`. Steps of the build that make considers
+# up to date leave their outputs untouched, so output mtimes cannot tell a fresh build
+BUILD_STAMP = ROOT_DIR / "tests/e2e/.build-stamp"
+
+
+def _build_is_fresh() -> bool:
+    """Check whether `make build` has succeeded since any of its inputs last changed."""
+    if not (ROOT_DIR / "sdks/python/.venv").is_dir() or not BUILD_STAMP.is_file():
+        return False
+    
+    for pattern in BUILD_ARTIFACTS:
+        if not any(ROOT_DIR.glob(pattern)):
+            return False
+    
+    source_mtimes = [
+        path.stat().st_mtime for pattern in BUILD_SOURCES for path in ROOT_DIR.glob(pattern)
+    ]
+    return BUILD_STAMP.stat().st_mtime > max(source_mtimes, default=0)
+
+
+def _infra_is_running() -> bool:
+    """Check whether the Redpanda container started by infra/ is up and healthy."""
+    engine = shutil.which("podman") or shutil.which("docker")
+    if engine is None:
+        return False
+    result = subprocess.run(
+        [engine, "container", "inspect", "--format", "{{.State.Health.Status}}", "redpanda"],
+        capture_output=True,
+        text=True,
+    )
+    return result.returncode == 0 and result.stdout.strip() == "healthy"
+
+
+def _build() -> None:
+    """Build the entire project, unless the build is up to date."""
+    if _build_is_fresh():
+        print("\n♻️  Build is up to date, skipping make build")
+    else:
+        print("\n🔨 Building project...")
+        subprocess.run(["make", "build"], check=True)
+        BUILD_STAMP.touch()
+
+
+def _start_infra() -> bool:
+    """Start Kafka infrastructure unless it is already running.
+    
+    Returns:
+        True if the infrastructure was started here.
+    """
+    if _infra_is_running():
+        print("\n♻️  Reusing running Kafka infrastructure")
+        return False
+    print("\n🚀 Starting Kafka infrastructure...")
+    subprocess.run(["make", "-C", "infra", "up"], check=True)
+    return True
+
+
+def _stop_infra(started: bool) -> None:
+    """Stop Kafka infrastructure started by the tests, unless EDA_TESTS_KEEP_INFRA=1."""
+    if started and os.environ.get("EDA_TESTS_KEEP_INFRA") != "1":
+        print("\n🛑 Stopping Kafka infrastructure...")
+        subprocess.run(["make", "-C", "infra", "down"], check=False)
+
+
+def _is_xdist_worker(config: pytest.Config) -> bool:
+    """Check whether this process is a pytest-xdist worker."""
+    return hasattr(config, "workerinput")
+
+
+def _is_xdist_controller(config: pytest.Config) -> bool:
+    """Check whether this process distributes tests to pytest-xdist workers."""
+    return not _is_xdist_worker(config) and bool(getattr(config.option, "numprocesses", None))
+
+
+# Whether the xdist controller started the infrastructure (and so must stop it)
+_infra_started_key = pytest.StashKey[bool]()
+
+
+def pytest_sessionstart(session: pytest.Session) -> None:
+    """With pytest-xdist, build and start infrastructure once, before workers run tests."""
+    if _is_xdist_controller(session.config):
+        _build()
+        session.config.stash[_infra_started_key] = _start_infra()
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """With pytest-xdist, stop infrastructure once all workers are done."""
+    if _is_xdist_controller(session.config):
+        _stop_infra(session.config.stash.get(_infra_started_key, False))
+
 
 @pytest.fixture(scope="session")
-def build_project():
-    """Build the entire project before running tests."""
-    print("\n🔨 Building project...")
-    subprocess.run(["make", "build"], check=True)
+def build_project(pytestconfig):
+    """Build the entire project before running tests, unless the build is up to date.
+    
+    Under pytest-xdist the controller has already built it.
+    """
+    if not _is_xdist_worker(pytestconfig):
+        _build()
     yield
 
 
 @pytest.fixture(scope="session")
-def kafka_infra():
-    """Start and stop Kafka infrastructure once for all tests."""
-    print("\n🚀 Starting Kafka infrastructure...")
-    subprocess.run(["make", "-C", "infra", "up"], check=True)
+def kafka_infra(pytestconfig):
+    """Start and stop Kafka infrastructure once for all tests.
+    
+    Infrastructure that is already running is reused and left running. Set
+    EDA_TESTS_KEEP_INFRA=1 to also keep infrastructure started by the tests.
+    Under pytest-xdist the controller starts and stops it for all workers.
+    """
+    if _is_xdist_worker(pytestconfig):
+        yield
+        return
+    
+    started = _start_infra()
     
     yield
     
-    print("\n🛑 Stopping Kafka infrastructure...")
-    subprocess.run(["make", "-C", "infra", "down"], check=False)
+    _stop_infra(started)
 
 
 @pytest.fixture
 def send_test_events(kafka_infra):
-    """Send test events to Kafka (depends on kafka_infra to ensure it's running)."""
-    def _send():
-        print("\n📤 Sending test events...")
-        subprocess.run(["make", "-C", "infra", "send-events"], check=True)
+    """Send test events to Kafka (depends on kafka_infra to ensure it's running).
+    
+    Returns a function taking the topic to send to, so each test can use its own.
+    """
+    def _send(topic: str):
+        print(f"\n📤 Sending test events to {topic}...")
+        env = os.environ.copy()
+        env["KAFKA_TOPIC"] = topic
+        subprocess.run(["make", "-C", "infra", "send-events"], check=True, env=env)
     return _send
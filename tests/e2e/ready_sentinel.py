@@ -0,0 +1,43 @@
+"""Run a Python example with its handler wrapped to report readiness.
+
+Used by the e2e tests in sentinel_only mode: the example runs silently
+(LOG_EVENTS=0) and this wrapper writes a single EDA_READY line to stderr
+once the example's handler has handled the given number of events.
+
+Usage: python ready_sentinel.py <path to example func.py> <events>
+"""
+
+import functools
+import importlib.util
+import itertools
+import sys
+
+from eda_sdk.ffi import run
+
+READY_LINE = "EDA_READY\n"
+
+
+def main() -> None:
+    """Load the example's handler, wrap it, and run it."""
+    path, ready_after = sys.argv[1], int(sys.argv[2])
+
+    # Import the example as a module, so its own run() call does not fire
+    spec = importlib.util.spec_from_file_location("example", path)
+    example = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(example)
+    handle = example.handle
+    handled = itertools.count(1)
+
+    # Keep the handler's annotations, which tell the SDK whether it returns events
+    @functools.wraps(handle)
+    def handle_and_report(event):
+        result = handle(event)
+        if next(handled) == ready_after:
+            sys.stderr.write(READY_LINE)
+        return result
+
+    run(handle_and_report)
+
+
+if __name__ == "__main__":
+    main()
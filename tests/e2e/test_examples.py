@@ -1,19 +1,62 @@
 """E2E tests for all examples."""
 
+import selectors
 import subprocess
 import time
 import pytest
 import os
 from pathlib import Path
 
+# Upper bound on how long the harness watches an example before stopping it
+MONITOR_TIMEOUT = 60
 
-def run_example_with_monitoring(command: list[str], expect_output: bool = False) -> tuple[bool, str]:
+# Bytes requested per read of the example output
+READ_SIZE = 65536
+
+# Output markers counted as success indicators (matched on raw output bytes)
+RECEIVED_MARKER = "📨 Received event:".encode()
+PUBLISHED_MARKER = b"Published output event to"
+
+# Events an example handles before ready_sentinel.py writes READY_SENTINEL to stderr
+READY_AFTER = 10
+READY_SENTINEL = b"EDA_READY\n"
+
+# Runs a Python example with its handler wrapped to write READY_SENTINEL
+READY_SENTINEL_RUNNER = Path(__file__).parent / "ready_sentinel.py"
+PYTHON_SDK_VENV_PYTHON = "sdks/python/.venv/bin/python"
+
+
+def _stop_process(process: subprocess.Popen) -> None:
+    """Terminate a running example gracefully, killing it if it does not exit in time."""
+    # Give enough time for Kafka consumer group LeaveGroup protocol
+    process.terminate()
+    try:
+        process.wait(timeout=60)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def run_example_with_monitoring(
+    command: list[str], topic: str, expect_output: bool = False, sentinel_only: bool = False
+) -> tuple[bool, str]:
     """
     Run an example and monitor output in real-time, terminating early when success criteria met.
     
+    Output is read with a selector as soon as it is available, so the success check
+    (and the overall MONITOR_TIMEOUT) never waits on a blocking line read.
+    
+    In sentinel_only mode the example logs no events and its stdout is discarded;
+    only stderr is read, for the single READY_SENTINEL line written once it has
+    handled READY_AFTER events. The command must run the example through
+    ready_sentinel.py, which writes that line.
+    
     Args:
         command: Command to run
+        topic: Kafka topic to consume, unique per test so examples can run in parallel;
+            also used as the consumer group
         expect_output: Whether to expect output events (for output examples)
+        sentinel_only: Whether to wait for READY_SENTINEL instead of counting log lines
     
     Returns:
         tuple: (success, output) where success is True if expected output found
@@ -22,70 +65,81 @@ def run_example_with_monitoring(command: list[str], expect_output: bool = False)
     env = os.environ.copy()
     env['EXAMPLE_TIMEOUT'] = '10'
     env['PYTHONUNBUFFERED'] = '1'
+    env['KAFKA_TOPIC'] = topic
+    env['KAFKA_GROUP'] = topic
+    if sentinel_only:
+        env['LOG_EVENTS'] = '0'
     
-    # Run process and capture output
+    # Run process and capture output (only stderr in sentinel_only mode)
     process = subprocess.Popen(
         command,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
+        stdout=subprocess.DEVNULL if sentinel_only else subprocess.PIPE,
+        stderr=subprocess.PIPE if sentinel_only else subprocess.STDOUT,
         env=env,
-        bufsize=1
     )
+    stream = process.stderr if sentinel_only else process.stdout
     
-    output_lines = []
+    output_parts = []
+    partial_line = b""
     received_count = 0
     published_count = 0
+    ready_count = 0
+    success = False
+    
+    selector = selectors.DefaultSelector()
+    selector.register(stream, selectors.EVENT_READ)
+    stream_fd = stream.fileno()
+    deadline = time.monotonic() + MONITOR_TIMEOUT
     
     try:
-        # Read output line by line
-        for line in process.stdout:
-            output_lines.append(line)
+        while not success:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                # Example hung without meeting the success criteria
+                _stop_process(process)
+                break
+            if not selector.select(timeout=remaining):
+                continue
+            
+            chunk = os.read(stream_fd, READ_SIZE)
+            eof = not chunk
+            output_parts.append(chunk)
             
-            # Count success indicators
-            if "📨 Received event:" in line:
-                received_count += 1
-            if "Published output event to" in line:
-                published_count += 1
+            # Count success indicators over all complete lines in the chunk at once;
+            # an unfinished last line is carried over so markers are never split
+            window = partial_line + chunk
+            end = len(window) if eof else window.rfind(b"\n") + 1
+            received_count += window.count(RECEIVED_MARKER, 0, end)
+            published_count += window.count(PUBLISHED_MARKER, 0, end)
+            ready_count += window.count(READY_SENTINEL, 0, end)
+            partial_line = window[end:]
             
             # Check if we've met success criteria
-            if expect_output:
-                if received_count >= 10 and published_count >= 10:
-                    # Success! Terminate the process gracefully
-                    # Give enough time for Kafka consumer group LeaveGroup protocol
-                    process.terminate()
-                    try:
-                        process.wait(timeout=60)
-                    except subprocess.TimeoutExpired:
-                        process.kill()
-                        process.wait()
-                    break
+            if sentinel_only:
+                success = ready_count >= 1
+            elif expect_output:
+                success = received_count >= 10 and published_count >= 10
             else:
-                if received_count >= 10:
-                    # Success! Terminate the process gracefully
-                    # Give enough time for Kafka consumer group LeaveGroup protocol
-                    process.terminate()
-                    try:
-                        process.wait(timeout=60)
-                    except subprocess.TimeoutExpired:
-                        process.kill()
-                        process.wait()
-                    break
+                success = received_count >= 10
+            
+            if eof:
+                # Wait for process to complete
+                process.wait(timeout=60)
+                break
         
-        # Wait for process to complete if it hasn't already
-        process.wait(timeout=60)
+        if success and process.poll() is None:
+            # Success! Terminate the process gracefully
+            _stop_process(process)
         
     except Exception:
         process.kill()
         process.wait()
+    finally:
+        selector.close()
+        stream.close()
     
-    output = ''.join(output_lines)
-    
-    # Final check
-    if expect_output:
-        success = received_count >= 10 and published_count >= 10
-    else:
-        success = received_count >= 10
+    # Decode only once, for the caller's report
+    output = b''.join(output_parts).decode('utf-8', errors='replace')
     
     return success, output
 
@@ -93,11 +147,12 @@ def run_example_with_monitoring(command: list[str], expect_output: bool = False)
 @pytest.mark.e2e
 def test_go_ffi_example(build_project, send_test_events):
     """Test Go FFI example."""
-    send_test_events()
+    send_test_events("e2e-go-ffi")
     time.sleep(2)  # Give Kafka time to have events ready
     
     success, output = run_example_with_monitoring(
         ["make", "-C", "sdks/go/examples/ffi-example", "run"],
+        topic="e2e-go-ffi",
         expect_output=False
     )
     
@@ -108,11 +163,12 @@ def test_go_ffi_example(build_project, send_test_events):
 @pytest.mark.e2e
 def test_go_ffi_output_example(build_project, send_test_events):
     """Test Go FFI output example."""
-    send_test_events()
+    send_test_events("e2e-go-ffi-output")
     time.sleep(2)
     
     success, output = run_example_with_monitoring(
         ["make", "-C", "sdks/go/examples/ffi-output-example", "run"],
+        topic="e2e-go-ffi-output",
         expect_output=True
     )
     
@@ -123,26 +179,33 @@ def test_go_ffi_output_example(build_project, send_test_events):
 @pytest.mark.e2e
 def test_python_ffi_example(build_project, send_test_events):
     """Test Python FFI example."""
-    send_test_events()
+    send_test_events("e2e-python-ffi")
     time.sleep(2)
     
     success, output = run_example_with_monitoring(
-        ["make", "-C", "sdks/python/examples/ffi", "run"],
-        expect_output=False
+        [
+            PYTHON_SDK_VENV_PYTHON,
+            str(READY_SENTINEL_RUNNER),
+            "sdks/python/examples/ffi/func.py",
+            str(READY_AFTER),
+        ],
+        topic="e2e-python-ffi",
+        sentinel_only=True
     )
     
-    print(f"\n📋 Python FFI Example Output:\n{output}")
+    print(f"\n📋 Python FFI Example Output (stderr):\n{output}")
     assert success, "Python FFI example did not process 10+ events successfully"
 
 
 @pytest.mark.e2e
 def test_python_ffi_output_example(build_project, send_test_events):
     """Test Python FFI output example."""
-    send_test_events()
+    send_test_events("e2e-python-ffi-output")
     time.sleep(2)
     
     success, output = run_example_with_monitoring(
         ["make", "-C", "sdks/python/examples/ffi-output", "run"],
+        topic="e2e-python-ffi-output",
         expect_output=True
     )
     